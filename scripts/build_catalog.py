@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Build Catalog Module
+Pre-compiles catalogs/vfd_catalog.yaml into scripts/vfd_catalog_data.py.
+
+The YAML catalog stays the editable source of truth. The generated module
+holds the same data as a Python literal plus a SHA-256 of the YAML it was
+built from; vfd_sizing only uses it while that hash still matches, and
+falls back to parsing the YAML otherwise.
+
+Re-run after editing the VFD catalog:
+    python scripts/build_catalog.py
+
+Author: Load List Skill
+"""
+
+import ast
+import hashlib
+import pprint
+from pathlib import Path
+
+import yaml
+
+CATALOG_PATH = Path(__file__).parent.parent / "catalogs" / "vfd_catalog.yaml"
+OUTPUT_PATH = Path(__file__).parent / "vfd_catalog_data.py"
+
+_HEADER = '''"""
+VFD catalog data, generated from catalogs/vfd_catalog.yaml.
+
+Do not edit; regenerate with: python scripts/build_catalog.py
+"""
+
+'''
+
+_TIMESTAMP_TAG = "tag:yaml.org,2002:timestamp"
+
+
+class _PlainScalarLoader(yaml.SafeLoader):
+    """SafeLoader that leaves dates and timestamps as strings."""
+
+
+# Keep every scalar a plain str/int/float/bool so the pprint output is a
+# Python literal (a date would come out as datetime.date(...))
+_PlainScalarLoader.yaml_implicit_resolvers = {
+    first: [(tag, regexp) for tag, regexp in resolvers if tag != _TIMESTAMP_TAG]
+    for first, resolvers in yaml.SafeLoader.yaml_implicit_resolvers.items()
+}
+
+
+def catalog_sha256(path: Path) -> str:
+    """SHA-256 of a catalog file's bytes."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def build_vfd_catalog_module(
+    catalog_path: Path = CATALOG_PATH,
+    output_path: Path = OUTPUT_PATH
+) -> Path:
+    """
+    Write the VFD catalog as an importable Python module.
+
+    Args:
+        catalog_path: Source YAML catalog
+        output_path: Generated module path
+
+    Returns:
+        Path of the generated module
+
+    Raises:
+        ValueError: If the catalog does not round-trip as a Python literal
+    """
+    source = catalog_path.read_bytes()
+    catalog = yaml.load(source, Loader=_PlainScalarLoader) or {}
+
+    literal = pprint.pformat(catalog, indent=1, width=100, sort_dicts=False)
+    if ast.literal_eval(literal) != catalog:
+        raise ValueError(f"{catalog_path} does not round-trip as a Python literal")
+
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write(_HEADER)
+        f.write(f"SOURCE_SHA256 = {hashlib.sha256(source).hexdigest()!r}\n\n")
+        f.write("CATALOG = ")
+        f.write(literal)
+        f.write("\n")
+
+    return output_path
+
+
+if __name__ == "__main__":
+    path = build_vfd_catalog_module()
+    print(f"Wrote {path}")
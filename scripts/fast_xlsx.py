@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+Fast XLSX Writer Module
+Streams worksheet XML directly instead of going through openpyxl's
+per-cell element serialization.
+
+XmlWorkbook is a drop-in replacement for openpyxl's write-only Workbook:
+sheets, named styles, column widths, freeze panes, filters and merges are
+all handled by openpyxl's own objects, and only the row data is emitted as
+hand-written XML. Strings go into a shared strings table.
+
+A sheet can also be rendered in another process: export() returns its
+XML and local shared strings, and load_rendered() splices them into a
+sheet of the target workbook.
+
+This builds on openpyxl internals, so it is only used with the openpyxl
+releases it was tested against; callers check OPENPYXL_SUPPORTED and
+otherwise write with Workbook(write_only=True).
+
+Usage:
+    wb = XmlWorkbook()
+    ws = wb.create_sheet("Loads")
+    ws.append(["P-101", 7.5])
+    wb.save("loads.xlsx")
+
+Author: Load List Skill
+"""
+
+import datetime
+import re
+from functools import lru_cache
+from xml.sax.saxutils import escape
+from zipfile import ZipFile, ZIP_DEFLATED, ZIP_STORED
+
+import openpyxl
+from openpyxl import Workbook
+from openpyxl.cell import Cell, WriteOnlyCell
+from openpyxl.compat import safe_string
+from openpyxl.packaging.extended import ExtendedProperties
+from openpyxl.packaging.manifest import Manifest, Override
+from openpyxl.packaging.relationship import Relationship, RelationshipList
+from openpyxl.styles.stylesheet import write_stylesheet
+from openpyxl.utils import get_column_letter
+from openpyxl.utils.datetime import to_excel
+from openpyxl.workbook._writer import WorkbookWriter
+from openpyxl.worksheet._write_only import WriteOnlyWorksheet
+from openpyxl.worksheet._writer import WorksheetWriter
+from openpyxl.writer.theme import theme_xml
+from openpyxl.xml.constants import (
+    ARC_APP, ARC_CORE, ARC_ROOT_RELS, ARC_SHARED_STRINGS, ARC_STYLE,
+    ARC_THEME, ARC_WORKBOOK, ARC_WORKBOOK_RELS, SHARED_STRINGS, SHEET_MAIN_NS,
+)
+from openpyxl.xml.functions import tostring
+
+
+# openpyxl releases XmlWorkbook was tested with, as [min, max). It relies
+# on private writers, name-mangled attributes and the serialized sheet XML,
+# none of which openpyxl keeps stable between releases.
+_OPENPYXL_TESTED = ((3, 1), (3, 2))
+
+
+def _release(version: str) -> tuple:
+    """Leading numeric parts of a version string ("3.1.5" -> (3, 1, 5))."""
+    parts = []
+    for part in version.split("."):
+        digits = re.match(r"\d+", part)
+        if digits is None:
+            break
+        parts.append(int(digits.group()))
+    return tuple(parts)
+
+
+OPENPYXL_SUPPORTED = _OPENPYXL_TESTED[0] <= _release(openpyxl.__version__) < _OPENPYXL_TESTED[1]
+
+_WORKSHEET_OPEN = f'<worksheet xmlns="{SHEET_MAIN_NS}">'
+
+# Shared string reference in rendered cell XML; text is escaped, so this
+# cannot occur inside a formula
+_SHARED_STRING_REF = re.compile(r't="s"><v>(\d+)</v>')
+
+# Sheet autofilter, which the workbook part also names (_FilterDatabase)
+_AUTO_FILTER_REF = re.compile(r'<autoFilter ref="([^"]+)"')
+
+
+@lru_cache(maxsize=None)
+def _column_letter(col_idx: int) -> str:
+    return get_column_letter(col_idx)
+
+
+def _text(value: str) -> str:
+    """Escape a string as a <t> element, preserving edge whitespace."""
+    if value != value.strip():
+        return f'<t xml:space="preserve">{escape(value)}</t>'
+    return f"<t>{escape(value)}</t>"
+
+
+class _ElementSink:
+    """Collects the elements WorksheetWriter would stream, as XML text."""
+
+    def __init__(self):
+        self.parts = []
+
+    def send(self, el):
+        if el is not None:
+            self.parts.append(tostring(el).decode("utf-8"))
+
+
+class _SheetPartsWriter(WorksheetWriter):
+    """
+    Reuses WorksheetWriter for everything outside <sheetData>.
+
+    write_top() and write_tail() serialize sheet properties, views, column
+    widths, filters, merges and margins exactly as openpyxl does.
+    """
+
+    def __init__(self, ws):
+        self.ws = ws
+        self.ws._hyperlinks = []
+        self.ws._comments = []
+        self._rels = RelationshipList()
+        self.xf = _ElementSink()
+
+    def take(self) -> str:
+        xml = "".join(self.xf.parts)
+        self.xf.parts = []
+        return xml
+
+
+class XmlWorksheet(WriteOnlyWorksheet):
+    """Write-only worksheet that serializes each appended row to XML text."""
+
+    def __init__(self, parent, title):
+        super().__init__(parent, title)
+        self._chunks = []
+        self._top = None
+        self._row_idx = 0
+        self._rendered = None
+
+    def append(self, row):
+        """
+        Serialize one row.
+
+        Args:
+            row: list, tuple, range or generator of values or cells
+        """
+        if self.closed:
+            self._already_saved()
+        if not isinstance(row, (list, tuple, range)):
+            row = list(row)
+        if self._top is None:
+            # Widths and panes are fixed once the first row is written
+            self._top = self._parts_writer()
+        self._row_idx += 1
+        row_idx = self._row_idx
+        strings = self.parent._shared_strings
+        scratch = None
+        out = [f'<row r="{row_idx}">']
+
+        for col_idx, value in enumerate(row, 1):
+            if value is None:
+                continue
+            if isinstance(value, Cell):
+                cell = value
+            else:
+                if scratch is None:
+                    scratch = WriteOnlyCell(self)
+                scratch.value = value
+                cell = scratch
+
+            value = cell._value
+            if value is None and not cell.has_style:
+                continue
+            data_type = cell.data_type
+            ref = f"{_column_letter(col_idx)}{row_idx}"
+            style = f' s="{cell.style_id}"' if cell.has_style else ""
+
+            if value is None or value == "":
+                if data_type == "s":
+                    out.append(f'<c r="{ref}"{style} t="inlineStr"/>')
+                elif data_type == "f":
+                    out.append(f'<c r="{ref}"{style}/>')
+                else:
+                    out.append(f'<c r="{ref}"{style} t="{data_type}"/>')
+            elif data_type == "n":
+                out.append(f'<c r="{ref}"{style} t="n"><v>{safe_string(value)}</v></c>')
+            elif data_type == "s":
+                idx = strings.get(value)
+                if idx is None:
+                    idx = strings[value] = len(strings)
+                out.append(f'<c r="{ref}"{style} t="s"><v>{idx}</v></c>')
+            elif data_type == "f":
+                out.append(f'<c r="{ref}"{style}><f>{escape(value[1:])}</f><v></v></c>')
+            elif data_type == "d":
+                value = to_excel(value, self.parent.epoch)
+                out.append(f'<c r="{ref}"{style} t="n"><v>{safe_string(value)}</v></c>')
+            else:
+                out.append(
+                    f'<c r="{ref}"{style} t="{data_type}">'
+                    f'<v>{escape(safe_string(value))}</v></c>'
+                )
+
+        out.append("</row>")
+        self._chunks.append("".join(out))
+
+    def close(self):
+        if self.closed:
+            self._already_saved()
+        if self._top is None:
+            self._top = self._parts_writer()
+        self._WriteOnlyWorksheet__saved = True
+
+    def _parts_writer(self) -> str:
+        self._writer = _SheetPartsWriter(self)
+        self._writer.write_top()
+        return self._writer.take()
+
+    def _xml_text(self) -> str:
+        if self._rendered is not None:
+            return self._rendered
+        self._writer.write_tail()
+        tail = self._writer.take()
+        rows = "".join(self._chunks)
+        return f'{_WORKSHEET_OPEN}{self._top}<sheetData>{rows}</sheetData>{tail}</worksheet>'
+
+    def to_xml(self) -> bytes:
+        """Complete sheet part; the sheet must be closed."""
+        return self._xml_text().encode("utf-8")
+
+    def export(self) -> tuple:
+        """
+        Close the sheet and hand its content to another workbook.
+
+        Returns:
+            (sheet XML, shared strings list) for load_rendered(); string
+            references in the XML index into that list
+        """
+        if not self.closed:
+            self.close()
+        return self._xml_text(), list(self.parent._shared_strings)
+
+    def load_rendered(self, xml: str, strings: list):
+        """
+        Use sheet XML exported from another XmlWorkbook as this sheet.
+
+        Style ids are taken as-is, so both workbooks must have registered
+        the styles used in the same order. Shared string references are
+        renumbered into this workbook's table, and the autofilter range is
+        read back so the workbook part can name it.
+
+        Args:
+            xml: Sheet XML from export()
+            strings: Shared strings list from export()
+        """
+        shared = self.parent._shared_strings
+        ids = []
+        for value in strings:
+            idx = shared.get(value)
+            if idx is None:
+                idx = shared[value] = len(shared)
+            ids.append(idx)
+        self._rendered = _SHARED_STRING_REF.sub(
+            lambda m: f't="s"><v>{ids[int(m.group(1))]}</v>', xml
+        )
+        auto_filter = _AUTO_FILTER_REF.search(xml)
+        if auto_filter:
+            self.auto_filter.ref = auto_filter.group(1)
+        self._WriteOnlyWorksheet__saved = True
+
+
+class XmlWorkbook(Workbook):
+    """
+    Write-only workbook whose sheets are emitted as hand-written XML.
+
+    Drop-in for Workbook(write_only=True) as used by yaml_to_xlsx: named
+    styles, WriteOnlyCell and all worksheet settings behave the same.
+    """
+
+    def __init__(self):
+        super().__init__(write_only=True)
+        self._shared_strings = {}
+
+    def create_sheet(self, title=None, index=None):
+        ws = XmlWorksheet(parent=self, title=title)
+        self._add_sheet(sheet=ws, index=index)
+        return ws
+
+    def _shared_strings_xml(self) -> bytes:
+        strings = self._shared_strings
+        items = "".join(f"<si>{_text(s)}</si>" for s in strings)
+        return (
+            f'<sst xmlns="{SHEET_MAIN_NS}" uniqueCount="{len(strings)}">'
+            f"{items}</sst>"
+        ).encode("utf-8")
+
+    def save(self, filename, compress_level: int = 6):
+        """
+        Write the workbook to an .xlsx file.
+
+        Args:
+            filename: Output path
+            compress_level: zlib level for the zip container; 0 stores the
+                parts uncompressed (default 6, zlib's own default)
+        """
+        self.properties.modified = datetime.datetime.now(
+            tz=datetime.timezone.utc
+        ).replace(tzinfo=None)
+        manifest = Manifest()
+
+        if compress_level:
+            archive = ZipFile(filename, "w", ZIP_DEFLATED, allowZip64=True,
+                              compresslevel=compress_level)
+        else:
+            archive = ZipFile(filename, "w", ZIP_STORED, allowZip64=True)
+
+        with archive:
+            archive.writestr(ARC_APP, tostring(ExtendedProperties().to_tree()))
+            archive.writestr(ARC_CORE, tostring(self.properties.to_tree()))
+            archive.writestr(ARC_THEME, theme_xml)
+
+            for idx, ws in enumerate(self.worksheets, 1):
+                ws._id = idx
+                if not ws.closed:
+                    ws.close()
+                archive.writestr(ws.path[1:], ws.to_xml())
+                manifest.append(ws)
+
+            archive.writestr(ARC_SHARED_STRINGS, self._shared_strings_xml())
+            manifest.Override.append(Override("/" + ARC_SHARED_STRINGS, SHARED_STRINGS))
+
+            archive.writestr(ARC_STYLE, tostring(write_stylesheet(self)))
+
+            writer = WorkbookWriter(self)
+            archive.writestr(ARC_ROOT_RELS, writer.write_root_rels())
+            archive.writestr(ARC_WORKBOOK, writer.write())
+            writer.rels.append(Relationship(type="sharedStrings", Target="sharedStrings.xml"))
+            archive.writestr(ARC_WORKBOOK_RELS, writer.write_rels())
+
+            manifest._write(archive, self)
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    from openpyxl import load_workbook
+    from openpyxl.styles import Font, NamedStyle
+
+    print("Testing fast_xlsx module...")
+    print("=" * 60)
+
+    print(f"\n1. openpyxl {openpyxl.__version__} "
+          f"({'supported' if OPENPYXL_SUPPORTED else 'NOT in tested range'})")
+
+    # Write a workbook through XmlWorkbook and read it back with openpyxl
+    print("\n2. Save and Reload")
+    wb = XmlWorkbook()
+    wb.add_named_style(NamedStyle(name="header", font=Font(bold=True)))
+    ws = wb.create_sheet("Loads")
+    ws.column_dimensions["A"].width = 14
+    ws.freeze_panes = "A2"
+    ws.auto_filter.ref = "A1:D3"
+    header = WriteOnlyCell(ws, value="Tag")
+    header.style = "header"
+    ws.append([header, "kW", "Date", "Total"])
+    ws.append(["P-101", 7.5, datetime.date(2026, 2, 1), "=SUM(B2:B3)"])
+    ws.append([" <pump & motor> ", 11, None, True])
+
+    # A second sheet rendered in its own workbook, as a worker would
+    other = XmlWorkbook()
+    other_ws = other.create_sheet()
+    other_ws.append(["P-101", "Spare"])
+    xml, strings = other_ws.export()
+    wb.create_sheet("MCC-100").load_rendered(xml, strings)
+
+    fd, path = tempfile.mkstemp(suffix=".xlsx")
+    os.close(fd)
+    try:
+        wb.save(path)
+        check = load_workbook(path)
+        loads = check["Loads"]
+        rows = [[cell.value for cell in row] for row in loads.iter_rows()]
+        assert check.sheetnames == ["Loads", "MCC-100"], check.sheetnames
+        assert rows[0] == ["Tag", "kW", "Date", "Total"], rows[0]
+        assert rows[1][:2] == ["P-101", 7.5] and rows[1][3] == "=SUM(B2:B3)", rows[1]
+        assert rows[1][2].date() == datetime.date(2026, 2, 1), rows[1][2]
+        assert rows[2] == [" <pump & motor> ", 11, None, True], rows[2]
+        assert loads["A1"].style == "header" and loads["A1"].font.bold
+        assert loads.freeze_panes == "A2" and loads.auto_filter.ref == "A1:D3"
+        assert loads.column_dimensions["A"].width == 14
+        assert [c.value for c in check["MCC-100"][1]] == ["P-101", "Spare"]
+        print(f"   {len(rows)} rows and 2 sheets read back unchanged")
+    finally:
+        os.remove(path)
+
+    print("\n" + "=" * 60)
+    print("All tests completed!")
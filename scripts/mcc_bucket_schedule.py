@@ -231,7 +231,8 @@ def generate_bucket(
             voltage=voltage,
             vfd_input_current=load.get("vfd_input_current_a"),
             vfd_max_scpd=load.get("vfd_max_ocpd_a"),
-            device_type=scpd_type
+            device_type=scpd_type,
+            verbose=True
         )
 
         bucket.update({
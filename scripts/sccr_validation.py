@@ -15,44 +15,44 @@ Standards Reference:
 Author: Load List Skill
 """
 
+import io
 import math
-from typing import Optional
+from typing import Optional, Sequence
 
 
-def calc_available_fault_current(
+_SQRT3 = math.sqrt(3)
+
+# Text report separators
+_REPORT_RULE = "=" * 70
+_SECTION_RULE = "-" * 40
+
+
+def _fault_core(
     transformer_kva: float,
     transformer_z_pct: float,
     secondary_voltage: float,
-    utility_fault_ka: Optional[float] = None,
-    cable_length_m: float = 0,
-    cable_size_mm2: float = 0
-) -> dict:
+    utility_fault_ka: float,
+    cable_length_m: float,
+    cable_size_mm2: float
+) -> tuple[float, float, float, float, float]:
     """
-    Calculate available fault current at a point in the system.
-
-    For preliminary estimates, calculates based on transformer only.
-    For more accuracy, includes utility contribution and cable impedance.
+    Numeric core of the available fault current calculation.
 
-    Args:
-        transformer_kva: Transformer kVA rating
-        transformer_z_pct: Transformer impedance (%)
-        secondary_voltage: Secondary voltage (V line-to-line)
-        utility_fault_ka: Available fault at transformer primary (kA)
-        cable_length_m: Cable length from transformer to point (m)
-        cable_size_mm2: Cable conductor size (mm²)
+    Kept free of dict construction and rounding so that scenario sweeps
+    (e.g. transformer kVA/Z combinations) only pay for the arithmetic.
 
     Returns:
-        dict with fault current calculations
+        (z_xfmr_ohm, z_utility_ohm, z_cable_ohm, z_total_ohm, i_fault_a)
     """
     # Transformer base values
-    i_base = transformer_kva * 1000 / (math.sqrt(3) * secondary_voltage)
+    i_base = transformer_kva * 1000 / (_SQRT3 * secondary_voltage)
     z_base = secondary_voltage ** 2 / (transformer_kva * 1000)
 
     # Transformer impedance in ohms
     z_xfmr_ohm = (transformer_z_pct / 100) * z_base
 
     # Utility impedance (if provided)
-    if utility_fault_ka and utility_fault_ka > 0:
+    if utility_fault_ka > 0:
         # Utility fault at primary, reflect to secondary
         # Approximate: Z_utility = V²/(√3 × V × I_fault)
         z_utility_pu = (i_base / 1000) / utility_fault_ka
@@ -73,7 +73,44 @@ def calc_available_fault_current(
     z_total_ohm = z_xfmr_ohm + z_utility_ohm + z_cable_ohm
 
     # Available fault current (3-phase symmetrical)
-    i_fault_a = secondary_voltage / (math.sqrt(3) * z_total_ohm)
+    i_fault_a = secondary_voltage / (_SQRT3 * z_total_ohm)
+
+    return z_xfmr_ohm, z_utility_ohm, z_cable_ohm, z_total_ohm, i_fault_a
+
+
+def calc_available_fault_current(
+    transformer_kva: float,
+    transformer_z_pct: float,
+    secondary_voltage: float,
+    utility_fault_ka: Optional[float] = None,
+    cable_length_m: float = 0,
+    cable_size_mm2: float = 0
+) -> dict:
+    """
+    Calculate available fault current at a point in the system.
+
+    For preliminary estimates, calculates based on transformer only.
+    For more accuracy, includes utility contribution and cable impedance.
+
+    Args:
+        transformer_kva: Transformer kVA rating
+        transformer_z_pct: Transformer impedance (%)
+        secondary_voltage: Secondary voltage (V line-to-line)
+        utility_fault_ka: Available fault at transformer primary (kA)
+        cable_length_m: Cable length from transformer to point (m)
+        cable_size_mm2: Cable conductor size (mm²)
+
+    Returns:
+        dict with fault current calculations
+    """
+    z_xfmr_ohm, z_utility_ohm, z_cable_ohm, z_total_ohm, i_fault_a = _fault_core(
+        transformer_kva,
+        transformer_z_pct,
+        secondary_voltage,
+        utility_fault_ka or 0,
+        cable_length_m,
+        cable_size_mm2
+    )
     i_fault_ka = i_fault_a / 1000
 
     return {
@@ -91,6 +128,41 @@ def calc_available_fault_current(
     }
 
 
+def sweep_available_fault_current(
+    transformer_kva: Sequence[float],
+    transformer_z_pct: Sequence[float],
+    secondary_voltage: float,
+    utility_fault_ka: Optional[float] = None,
+    cable_length_m: float = 0,
+    cable_size_mm2: float = 0
+) -> list[float]:
+    """
+    Available fault current (kA) for a sweep of transformer kVA/Z pairs.
+
+    Intended for upstream transformer sizing studies where thousands of
+    combinations are evaluated; returns unrounded kA values only.
+
+    Args:
+        transformer_kva: Transformer kVA ratings
+        transformer_z_pct: Transformer impedances (%), same length as kVA
+        secondary_voltage: Secondary voltage (V line-to-line)
+        utility_fault_ka: Available fault at transformer primary (kA)
+        cable_length_m: Cable length from transformer to point (m)
+        cable_size_mm2: Cable conductor size (mm²)
+
+    Returns:
+        list of available fault currents in kA
+    """
+    if len(transformer_kva) != len(transformer_z_pct):
+        raise ValueError("transformer_kva and transformer_z_pct must be the same length")
+
+    utility = utility_fault_ka or 0
+    return [
+        _fault_core(kva, z_pct, secondary_voltage, utility, cable_length_m, cable_size_mm2)[4] / 1000
+        for kva, z_pct in zip(transformer_kva, transformer_z_pct)
+    ]
+
+
 def get_default_sccr_by_device(device_type: str, fuse_class: Optional[str] = None) -> float:
     """
     Get typical SCCR for device types.
@@ -134,6 +206,24 @@ def get_default_sccr_by_device(device_type: str, fuse_class: Optional[str] = Non
         return 10  # Conservative default
 
 
+def _resolve_bucket_sccr(bucket: dict) -> tuple[float, str]:
+    """
+    Bucket SCCR in kA, estimated from device type when not specified.
+
+    Returns:
+        (bucket_sccr_ka, sccr_source)
+    """
+    bucket_sccr = bucket.get("sccr_ka", 0)
+
+    # If no SCCR specified, estimate from device type
+    if bucket_sccr == 0:
+        device_type = bucket.get("branch_scpd_type", "mccb")
+        fuse_class = bucket.get("fuse_class")
+        return get_default_sccr_by_device(device_type, fuse_class), "estimated_from_device_type"
+
+    return bucket_sccr, "specified"
+
+
 def validate_bucket_sccr(
     bucket: dict,
     available_fault_ka: float
@@ -148,17 +238,8 @@ def validate_bucket_sccr(
     Returns:
         dict with validation result
     """
-    bucket_sccr = bucket.get("sccr_ka", 0)
     bucket_id = bucket.get("bucket_id", "Unknown")
-
-    # If no SCCR specified, estimate from device type
-    if bucket_sccr == 0:
-        device_type = bucket.get("branch_scpd_type", "mccb")
-        fuse_class = bucket.get("fuse_class")
-        bucket_sccr = get_default_sccr_by_device(device_type, fuse_class)
-        sccr_source = "estimated_from_device_type"
-    else:
-        sccr_source = "specified"
+    bucket_sccr, sccr_source = _resolve_bucket_sccr(bucket)
 
     compliant = bucket_sccr >= available_fault_ka
     margin_ka = bucket_sccr - available_fault_ka
@@ -210,13 +291,15 @@ def validate_lineup_sccr(
     bucket_results = []
     bucket_sccrs = []
     non_compliant_buckets = []
+    non_compliant_indices = []
 
-    for bucket in buckets:
+    for i, bucket in enumerate(buckets):
         result = validate_bucket_sccr(bucket, available_fault_ka)
         bucket_results.append(result)
         bucket_sccrs.append(result["bucket_sccr_ka"])
         if not result["compliant"]:
             non_compliant_buckets.append(result["bucket_id"])
+            non_compliant_indices.append(i)
 
     # Preliminary worst-case: min of individual bucket SCCRs
     # ACTUAL lineup SCCR may differ due to combination ratings
@@ -229,9 +312,9 @@ def validate_lineup_sccr(
     # Overall compliance
     compliant = lineup_sccr >= available_fault_ka
 
-    # Find limiting bucket
-    limiting_bucket = min(buckets, key=lambda b: b.get("sccr_ka", 999))
-    limiting_bucket_id = limiting_bucket.get("bucket_id", "Unknown")
+    # Find limiting bucket (lowest resolved SCCR, estimates included)
+    limiting_idx = min(range(len(bucket_sccrs)), key=bucket_sccrs.__getitem__)
+    limiting_bucket_id = buckets[limiting_idx].get("bucket_id", "Unknown")
 
     return {
         "panel_tag": panel_tag,
@@ -244,6 +327,7 @@ def validate_lineup_sccr(
         "margin_ka": round(lineup_sccr - available_fault_ka, 1),
         "limiting_bucket": limiting_bucket_id,
         "non_compliant_buckets": non_compliant_buckets,
+        "non_compliant_indices": non_compliant_indices,
         "bucket_results": bucket_results,
         "warning": (
             None if manufacturer_sccr
@@ -256,60 +340,71 @@ def validate_lineup_sccr(
     }
 
 
+# SCCR upgrade options as (max shortfall kA, option), sorted by descending
+# threshold so selection can stop at the first option that cannot cover it
+_UPGRADE_OPTIONS = (
+    (186, {  # Class J fuses typically 200 kA
+        "option": "Replace MCCB with Class J fused disconnect",
+        "expected_sccr_ka": 200,
+        "notes": "Class J fuses provide excellent current limiting"
+    }),
+    (86, {  # Current-limiting MCCB typically 100 kA
+        "option": "Replace with current-limiting MCCB",
+        "expected_sccr_ka": 100,
+        "notes": "Higher cost but compact solution"
+    }),
+    (47, {  # High-interrupt MCCB typically 65 kA
+        "option": "Replace with high-interrupt MCCB",
+        "expected_sccr_ka": 65,
+        "notes": "Available from most manufacturers"
+    }),
+)
+
+_SERIES_RATING_OPTION = {
+    "option": "Use UL-listed series rating combination",
+    "expected_sccr_ka": "varies",
+    "notes": "Coordinate with manufacturer for tested combinations"
+}
+
+
 def recommend_sccr_upgrades(
-    lineup_validation: dict
+    lineup_validation: dict,
+    indices: Optional[Sequence[int]] = None
 ) -> list[dict]:
     """
     Recommend SCCR upgrades for non-compliant buckets.
 
     Args:
         lineup_validation: Output from validate_lineup_sccr
+        indices: Positions of non-compliant entries in bucket_results
+            (e.g. "non_compliant_indices"); scans bucket_results if None
 
     Returns:
         list of upgrade recommendations
     """
     recommendations = []
     available_fault = lineup_validation["available_fault_ka"]
+    bucket_results = lineup_validation.get("bucket_results", [])
+
+    if indices is None:
+        candidates = bucket_results
+    else:
+        candidates = [bucket_results[i] for i in indices]
 
-    for bucket_result in lineup_validation.get("bucket_results", []):
+    for bucket_result in candidates:
         if not bucket_result["compliant"]:
             bucket_id = bucket_result["bucket_id"]
             current_sccr = bucket_result["bucket_sccr_ka"]
             shortfall = available_fault - current_sccr
 
-            # Recommend upgrade options
+            # Upgrade options whose expected SCCR covers the shortfall,
+            # plus series rating which always applies
             options = []
-
-            # Option 1: Current-limiting fuses
-            if shortfall <= 186:  # Class J fuses typically 200 kA
-                options.append({
-                    "option": "Replace MCCB with Class J fused disconnect",
-                    "expected_sccr_ka": 200,
-                    "notes": "Class J fuses provide excellent current limiting"
-                })
-
-            # Option 2: High-interrupt MCCB
-            if shortfall <= 47:  # High-interrupt MCCB typically 65 kA
-                options.append({
-                    "option": "Replace with high-interrupt MCCB",
-                    "expected_sccr_ka": 65,
-                    "notes": "Available from most manufacturers"
-                })
-
-            # Option 3: Current-limiting MCCB
-            if shortfall <= 86:  # Current-limiting MCCB typically 100 kA
-                options.append({
-                    "option": "Replace with current-limiting MCCB",
-                    "expected_sccr_ka": 100,
-                    "notes": "Higher cost but compact solution"
-                })
-
-            # Option 4: Series rating
-            options.append({
-                "option": "Use UL-listed series rating combination",
-                "expected_sccr_ka": "varies",
-                "notes": "Coordinate with manufacturer for tested combinations"
-            })
+            for threshold, option in _UPGRADE_OPTIONS:
+                if shortfall > threshold:
+                    break
+                options.append(dict(option))
+            options.append(dict(_SERIES_RATING_OPTION))
 
             recommendations.append({
                 "bucket_id": bucket_id,
@@ -356,7 +451,10 @@ def validate_panel_sccr_complete(
     # Get upgrade recommendations if needed
     upgrades = []
     if not validation["compliant"]:
-        upgrades = recommend_sccr_upgrades(validation)
+        upgrades = recommend_sccr_upgrades(
+            validation,
+            indices=validation.get("non_compliant_indices")
+        )
 
     return {
         "panel_tag": panel.get("panel_tag", "Unknown"),
@@ -373,6 +471,100 @@ def validate_panel_sccr_complete(
     }
 
 
+def validate_panels_batch(
+    panels: list[dict],
+    transformers: Sequence[tuple[float, float, float]]
+) -> list[dict]:
+    """
+    Summary SCCR validation for many panels in one pass.
+
+    Bucket SCCRs for all panels are staged into one flat list with panel
+    offsets, so each panel's fault current is computed once and the
+    per-panel minimum/limiting bucket come from a single slice scan.
+    Upgrade recommendations are only built for non-compliant panels.
+
+    Unlike validate_panel_sccr_complete, per-bucket result dicts are not
+    returned; use that function for the detailed report of a single panel.
+
+    Args:
+        panels: MCC panel dicts with buckets
+        transformers: (transformer_kva, transformer_z_pct, secondary_voltage)
+            for the upstream transformer of each panel
+
+    Returns:
+        list of panel summary dicts, in the same order as panels
+    """
+    if len(panels) != len(transformers):
+        raise ValueError("panels and transformers must be the same length")
+
+    # Stage bucket SCCRs as a flat list with panel offsets
+    sccrs = []
+    offsets = [0]
+    for panel in panels:
+        sccrs.extend(_resolve_bucket_sccr(b)[0] for b in panel.get("buckets", []))
+        offsets.append(len(sccrs))
+
+    results = []
+    for p_idx, (panel, (kva, z_pct, voltage)) in enumerate(zip(panels, transformers)):
+        panel_tag = panel.get("panel_tag", "Unknown")
+        start, end = offsets[p_idx], offsets[p_idx + 1]
+        available_fault = round(_fault_core(kva, z_pct, voltage, 0, 0, 0)[4] / 1000, 1)
+
+        if start == end:
+            results.append({
+                "panel_tag": panel_tag,
+                "available_fault_ka": available_fault,
+                "error": "No buckets defined",
+                "compliant": False,
+                "overall_status": "ACTION REQUIRED"
+            })
+            continue
+
+        panel_sccrs = sccrs[start:end]
+        limiting_idx = min(range(len(panel_sccrs)), key=panel_sccrs.__getitem__)
+        preliminary_sccr = panel_sccrs[limiting_idx]
+
+        manufacturer_sccr = panel.get("manufacturer_lineup_sccr_ka")
+        lineup_sccr = manufacturer_sccr if manufacturer_sccr else preliminary_sccr
+        compliant = lineup_sccr >= available_fault
+
+        buckets = panel["buckets"]
+        non_compliant = [
+            i for i, sccr in enumerate(panel_sccrs) if sccr < available_fault
+        ]
+
+        # Second pass only for panels that need upgrades
+        upgrades = []
+        if not compliant:
+            upgrades = recommend_sccr_upgrades({
+                "available_fault_ka": available_fault,
+                "bucket_results": [
+                    {
+                        "bucket_id": buckets[i].get("bucket_id", "Unknown"),
+                        "bucket_sccr_ka": panel_sccrs[i],
+                        "compliant": False
+                    }
+                    for i in non_compliant
+                ]
+            })
+
+        results.append({
+            "panel_tag": panel_tag,
+            "available_fault_ka": available_fault,
+            "lineup_sccr_ka": lineup_sccr,
+            "sccr_source": "manufacturer_tested" if manufacturer_sccr else "preliminary_worst_case",
+            "preliminary_min_sccr_ka": preliminary_sccr,
+            "compliant": compliant,
+            "margin_ka": round(lineup_sccr - available_fault, 1),
+            "limiting_bucket": buckets[limiting_idx].get("bucket_id", "Unknown"),
+            "non_compliant_buckets": [buckets[i].get("bucket_id", "Unknown") for i in non_compliant],
+            "upgrade_recommendations": upgrades,
+            "overall_status": "COMPLIANT" if compliant else "ACTION REQUIRED"
+        })
+
+    return results
+
+
 def format_sccr_report(analysis: dict) -> str:
     """
     Format SCCR analysis as text report.
@@ -383,65 +575,64 @@ def format_sccr_report(analysis: dict) -> str:
     Returns:
         Formatted text report
     """
-    lines = []
-    lines.append("=" * 70)
-    lines.append(f"SCCR VALIDATION REPORT - {analysis['panel_tag']}")
-    lines.append("=" * 70)
-    lines.append("")
+    buf = io.StringIO()
+    w = buf.write
+
+    w(f"{_REPORT_RULE}\nSCCR VALIDATION REPORT - {analysis['panel_tag']}\n{_REPORT_RULE}\n\n")
 
     # Fault current
     fc = analysis["fault_current_analysis"]
-    lines.append("AVAILABLE FAULT CURRENT")
-    lines.append("-" * 40)
-    lines.append(f"  Transformer: {fc['transformer_kva']} kVA, {fc['transformer_z_pct']}% Z")
-    lines.append(f"  Secondary Voltage: {fc['secondary_voltage_v']} V")
-    lines.append(f"  Available Fault: {fc['available_fault_ka']} kA")
-    lines.append(f"  Calculation Basis: {fc['calculation_basis']}")
-    lines.append("")
+    w(
+        f"AVAILABLE FAULT CURRENT\n{_SECTION_RULE}\n"
+        f"  Transformer: {fc['transformer_kva']} kVA, {fc['transformer_z_pct']}% Z\n"
+        f"  Secondary Voltage: {fc['secondary_voltage_v']} V\n"
+        f"  Available Fault: {fc['available_fault_ka']} kA\n"
+        f"  Calculation Basis: {fc['calculation_basis']}\n\n"
+    )
 
     # SCCR validation
     sv = analysis["sccr_validation"]
-    lines.append("LINEUP SCCR VALIDATION")
-    lines.append("-" * 40)
-    lines.append(f"  Lineup SCCR: {sv['lineup_sccr_ka']} kA ({sv['sccr_source']})")
-    lines.append(f"  Available Fault: {sv['available_fault_ka']} kA")
-    lines.append(f"  Margin: {sv['margin_ka']} kA")
-    lines.append(f"  Status: {analysis['overall_status']}")
+    w(
+        f"LINEUP SCCR VALIDATION\n{_SECTION_RULE}\n"
+        f"  Lineup SCCR: {sv['lineup_sccr_ka']} kA ({sv['sccr_source']})\n"
+        f"  Available Fault: {sv['available_fault_ka']} kA\n"
+        f"  Margin: {sv['margin_ka']} kA\n"
+        f"  Status: {analysis['overall_status']}\n"
+    )
     if sv["warning"]:
-        lines.append(f"  WARNING: {sv['warning']}")
-    lines.append("")
+        w(f"  WARNING: {sv['warning']}\n")
+    w("\n")
 
     # Non-compliant buckets
     if sv["non_compliant_buckets"]:
-        lines.append("NON-COMPLIANT BUCKETS")
-        lines.append("-" * 40)
+        w(f"NON-COMPLIANT BUCKETS\n{_SECTION_RULE}\n")
         for bucket_id in sv["non_compliant_buckets"]:
-            lines.append(f"  • {bucket_id}")
-        lines.append("")
+            w(f"  • {bucket_id}\n")
+        w("\n")
 
     # Upgrade recommendations
     if analysis["upgrade_recommendations"]:
-        lines.append("UPGRADE RECOMMENDATIONS")
-        lines.append("-" * 40)
+        w(f"UPGRADE RECOMMENDATIONS\n{_SECTION_RULE}\n")
         for rec in analysis["upgrade_recommendations"]:
-            lines.append(f"  {rec['bucket_id']}:")
-            lines.append(f"    Current SCCR: {rec['current_sccr_ka']} kA")
-            lines.append(f"    Required: {rec['required_sccr_ka']} kA")
-            lines.append(f"    Options:")
+            w(
+                f"  {rec['bucket_id']}:\n"
+                f"    Current SCCR: {rec['current_sccr_ka']} kA\n"
+                f"    Required: {rec['required_sccr_ka']} kA\n"
+                f"    Options:\n"
+            )
             for opt in rec["upgrade_options"]:
-                lines.append(f"      - {opt['option']} ({opt['expected_sccr_ka']} kA)")
-        lines.append("")
+                w(f"      - {opt['option']} ({opt['expected_sccr_ka']} kA)\n")
+        w("\n")
 
     # Disclaimers
-    lines.append("DISCLAIMERS")
-    lines.append("-" * 40)
+    w(f"DISCLAIMERS\n{_SECTION_RULE}\n")
     for disc in analysis["disclaimers"]:
-        lines.append(f"  • {disc}")
-    lines.append("")
+        w(f"  • {disc}\n")
+    w("\n")
 
-    lines.append("=" * 70)
+    w(_REPORT_RULE)
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 if __name__ == "__main__":
@@ -487,5 +678,47 @@ if __name__ == "__main__":
     )
     print(format_sccr_report(analysis))
 
+    # Transformer sweep
+    print("\n4. Fault Current Sweep (480V)")
+    sweep_kva = [500, 750, 1000, 1500, 2000]
+    sweep_z = [5.75] * len(sweep_kva)
+    for kva, ka in zip(sweep_kva, sweep_available_fault_current(sweep_kva, sweep_z, 480)):
+        print(f"   {kva} kVA: {ka:.1f} kA")
+
+    # Multi-panel batch
+    print("\n5. Batch Panel Validation")
+    second_panel = {
+        "panel_tag": "MCC-300",
+        "buckets": [
+            {"bucket_id": "MCC-300-01", "sccr_ka": 65, "branch_scpd_type": "mccb"},
+            {"bucket_id": "MCC-300-02", "branch_scpd_type": "fuse", "fuse_class": "J"},
+        ]
+    }
+    batch = validate_panels_batch(
+        [sample_panel, second_panel],
+        [(1000, 5.75, 480), (2000, 5.75, 480)]
+    )
+    for summary in batch:
+        print(f"   {summary['panel_tag']}: {summary['overall_status']} "
+              f"(lineup {summary['lineup_sccr_ka']} kA vs {summary['available_fault_ka']} kA, "
+              f"limiting {summary['limiting_bucket']})")
+
+    # Batch and single-panel paths must name the same limiting bucket,
+    # including when an unrated bucket's estimate is the lowest
+    unrated_panel = {
+        "panel_tag": "MCC-400",
+        "buckets": [
+            {"bucket_id": "MCC-400-01", "sccr_ka": 65, "branch_scpd_type": "mccb"},
+            {"bucket_id": "MCC-400-02", "branch_scpd_type": "mccb"},
+            {"bucket_id": "MCC-400-03", "sccr_ka": 42, "branch_scpd_type": "mccb"},
+        ]
+    }
+    check_panels = [sample_panel, second_panel, unrated_panel]
+    check_xfmrs = [(1000, 5.75, 480), (2000, 5.75, 480), (1500, 5.75, 480)]
+    for panel, summary in zip(check_panels, validate_panels_batch(check_panels, check_xfmrs)):
+        single = validate_lineup_sccr(panel, summary["available_fault_ka"])
+        assert single["limiting_bucket"] == summary["limiting_bucket"], panel["panel_tag"]
+    print("   Limiting bucket matches validate_lineup_sccr for all panels")
+
     print("\n" + "=" * 60)
     print("All tests completed!")
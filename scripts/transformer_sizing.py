@@ -13,26 +13,47 @@ Author: Load List Skill
 Standards: ANSI/IEEE C57.12, IEC 60076
 """
 
+import bisect
 import math
 from pathlib import Path
-from typing import Optional, Literal
+from typing import Optional, Literal, Sequence
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
 
-# Standard transformer sizes
-ANSI_STANDARD_KVA = [15, 25, 37.5, 50, 75, 100, 112.5, 150, 167, 200, 225, 300, 500, 750, 1000, 1500, 2000, 2500]
-IEC_STANDARD_KVA = [16, 25, 40, 63, 100, 160, 200, 250, 315, 400, 500, 630, 800, 1000, 1250, 1600, 2000, 2500]
+
+# Standard transformer sizes (ascending, searched with bisect)
+ANSI_STANDARD_KVA = (15, 25, 37.5, 50, 75, 100, 112.5, 150, 167, 200, 225, 300, 500, 750, 1000, 1500, 2000, 2500)
+IEC_STANDARD_KVA = (16, 25, 40, 63, 100, 160, 200, 250, 315, 400, 500, 630, 800, 1000, 1250, 1600, 2000, 2500)
+
+_STANDARD_SIZES = {"ANSI": ANSI_STANDARD_KVA, "IEC": IEC_STANDARD_KVA}
+
+# Typical impedance (%) by transformer type: (max kVA breakpoints, impedance)
+_TYPICAL_IMPEDANCE = {
+    "dry_type": ((50, 150, 300, 750, math.inf), (3.0, 4.5, 5.0, 5.5, 5.75)),
+    "oil_filled": ((100, 333, 750, math.inf), (2.5, 4.0, 5.0, 5.5)),
+}
+
+# Transformer catalog cache
+_TRANSFORMER_CATALOG: Optional[dict] = None
 
 
 def load_transformer_catalog() -> dict:
-    """Load transformer catalog."""
-    catalogs_dir = Path(__file__).parent.parent / "catalogs"
-    path = catalogs_dir / "transformers.yaml"
-    if path.exists():
-        with open(path) as f:
-            return yaml.safe_load(f)
-    return {}
+    """Load transformer catalog (parsed once, then cached)."""
+    global _TRANSFORMER_CATALOG
+    if _TRANSFORMER_CATALOG is None:
+        catalogs_dir = Path(__file__).parent.parent / "catalogs"
+        path = catalogs_dir / "transformers.yaml"
+        if path.exists():
+            with open(path) as f:
+                _TRANSFORMER_CATALOG = yaml.load(f, Loader=_YamlLoader)
+        else:
+            _TRANSFORMER_CATALOG = {}
+    return _TRANSFORMER_CATALOG
 
 
 def get_typical_impedance(kva: float, transformer_type: str = "dry_type") -> float:
@@ -47,26 +68,8 @@ def get_typical_impedance(kva: float, transformer_type: str = "dry_type") -> flo
         Typical impedance percentage
     """
     # Typical impedance ranges
-    if transformer_type == "dry_type":
-        if kva <= 50:
-            return 3.0
-        elif kva <= 150:
-            return 4.5
-        elif kva <= 300:
-            return 5.0
-        elif kva <= 750:
-            return 5.5
-        else:
-            return 5.75
-    else:  # oil_filled
-        if kva <= 100:
-            return 2.5
-        elif kva <= 333:
-            return 4.0
-        elif kva <= 750:
-            return 5.0
-        else:
-            return 5.5
+    keys, values = _TYPICAL_IMPEDANCE.get(transformer_type, _TYPICAL_IMPEDANCE["oil_filled"])
+    return values[bisect.bisect_left(keys, kva)]
 
 
 def size_transformer(
@@ -96,19 +99,15 @@ def size_transformer(
     minimum_kva = required_kva / (max_loading_pct / 100)
 
     # Select standard size
-    standard_sizes = ANSI_STANDARD_KVA if standard == "ANSI" else IEC_STANDARD_KVA
+    standard_sizes = _STANDARD_SIZES.get(standard, IEC_STANDARD_KVA)
+    idx = bisect.bisect_left(standard_sizes, minimum_kva)
 
-    selected_kva = None
-    for size in standard_sizes:
-        if size >= minimum_kva:
-            selected_kva = size
-            break
-
-    if selected_kva is None:
+    if idx < len(standard_sizes):
+        selected_kva = standard_sizes[idx]
+        notes = None
+    else:
         selected_kva = standard_sizes[-1]
         notes = f"Warning: Demand exceeds largest standard size ({standard_sizes[-1]} kVA)"
-    else:
-        notes = None
 
     # Calculate loading percentages
     loading_at_demand = (demand_kva / selected_kva) * 100
@@ -137,6 +136,78 @@ def size_transformer(
     }
 
 
+def size_transformers_batch(
+    connected_kva: Sequence[float],
+    demand_kva: Sequence[float],
+    future_growth_pct: float = 20,
+    standard: Literal["ANSI", "IEC"] = "ANSI",
+    max_loading_pct: float = 85
+) -> dict:
+    """
+    Size transformers for many feeders/MCCs in one call.
+
+    Same method as size_transformer, but results are returned as parallel
+    lists (one entry per input) rather than one dict per transformer.
+
+    Args:
+        connected_kva: Total connected load per transformer (kVA)
+        demand_kva: Demand load after diversity per transformer (kVA)
+        future_growth_pct: Future growth allowance percentage
+        standard: ANSI or IEC for standard sizes
+        max_loading_pct: Maximum acceptable loading percentage
+
+    Returns:
+        dict of lists keyed like size_transformer results, plus
+        exceeds_largest_size flags
+    """
+    if len(connected_kva) != len(demand_kva):
+        raise ValueError("connected_kva and demand_kva must be the same length")
+
+    standard_sizes = _STANDARD_SIZES.get(standard, IEC_STANDARD_KVA)
+    last_idx = len(standard_sizes) - 1
+    growth = 1 + future_growth_pct / 100
+    max_loading = max_loading_pct / 100
+    dry_keys, dry_values = _TYPICAL_IMPEDANCE["dry_type"]
+
+    required = [d * growth for d in demand_kva]
+    indices = [bisect.bisect_left(standard_sizes, r / max_loading) for r in required]
+    selected = [standard_sizes[min(i, last_idx)] for i in indices]
+    loading_with_growth = [r / kva * 100 for r, kva in zip(required, selected)]
+
+    return {
+        "connected_kva": [round(c, 1) for c in connected_kva],
+        "demand_kva": [round(d, 1) for d in demand_kva],
+        "required_kva": [round(r, 1) for r in required],
+        "selected_kva": selected,
+        "loading_at_demand_pct": [round(d / kva * 100, 1) for d, kva in zip(demand_kva, selected)],
+        "loading_with_growth_pct": [round(pct, 1) for pct in loading_with_growth],
+        "spare_capacity_pct": [round(100 - pct, 1) for pct in loading_with_growth],
+        "typical_impedance_pct": [dry_values[bisect.bisect_left(dry_keys, kva)] for kva in selected],
+        "exceeds_largest_size": [i > last_idx for i in indices],
+        "future_growth_pct": future_growth_pct,
+        "standard": standard
+    }
+
+
+def _starting_kva_scalar(motor_kw: float, lra_multiplier: float = 6.0) -> float:
+    """
+    Motor starting kVA as a plain float (0.85 running pf assumed).
+
+    Starting kVA = Running kVA × LRA multiplier × (running pf / starting pf)
+    Simplified: Starting kVA ≈ Running kVA × LRA multiplier
+    """
+    return motor_kw / 0.85 * lra_multiplier
+
+
+def _vdip_scalar(starting_kva: float, transformer_kva: float, total_z_pct: float) -> float:
+    """
+    Voltage dip (%) during motor start as a plain float.
+
+    Vdip% ≈ (Starting kVA / Transformer kVA) × Z%
+    """
+    return (starting_kva / transformer_kva) * total_z_pct
+
+
 def calc_motor_starting_kva(
     motor_hp: Optional[float] = None,
     motor_kw: Optional[float] = None,
@@ -164,10 +235,7 @@ def calc_motor_starting_kva(
 
     # Estimate running kVA (assuming 0.85 pf at full load)
     motor_kva_running = motor_kw / 0.85
-
-    # Starting kVA = Running kVA × LRA multiplier × (running pf / starting pf)
-    # Simplified: Starting kVA ≈ Running kVA × LRA multiplier
-    starting_kva = motor_kva_running * lra_multiplier
+    starting_kva = _starting_kva_scalar(motor_kw, lra_multiplier)
 
     return {
         "motor_kw": motor_kw,
@@ -207,8 +275,7 @@ def calc_voltage_dip_during_start(
     total_z_pct = transformer_impedance_pct + (system_impedance_pu * 100)
 
     # Voltage dip calculation
-    # Vdip% ≈ (Starting kVA / Transformer kVA) × Z%
-    vdip_pct = (starting_kva / transformer_kva) * total_z_pct
+    vdip_pct = _vdip_scalar(starting_kva, transformer_kva, total_z_pct)
 
     # Assess impact
     if vdip_pct <= 10:
@@ -239,6 +306,24 @@ def calc_voltage_dip_during_start(
     }
 
 
+def _find_largest_motor(motors: list[dict]) -> tuple[float, str]:
+    """
+    Find the largest motor by kW (HP converted at 0.746 kW/HP).
+
+    Returns:
+        (largest_kw, largest_tag); (0, "") if no motor has a positive rating
+    """
+    kws = [
+        max(m.get("rated_kw", m.get("installed_kw", 0)) or 0, (m.get("hp") or 0) * 0.746)
+        for m in motors
+    ]
+    i = max(range(len(kws)), key=kws.__getitem__)
+
+    if kws[i] <= 0:
+        return 0, ""
+    return kws[i], motors[i].get("equipment_tag", motors[i].get("tag", ""))
+
+
 def check_motor_starting(
     motors: list[dict],
     transformer_kva: float,
@@ -259,21 +344,10 @@ def check_motor_starting(
         return {"error": "No motors provided"}
 
     # Find largest motor
-    largest_kw = 0
-    largest_tag = ""
-
-    for motor in motors:
-        kw = motor.get("rated_kw", motor.get("installed_kw", 0))
-        if motor.get("hp"):
-            kw = max(kw, motor["hp"] * 0.746)
+    largest_kw, largest_tag = _find_largest_motor(motors)
 
-        if kw > largest_kw:
-            largest_kw = kw
-            largest_tag = motor.get("equipment_tag", motor.get("tag", ""))
-
-    # Calculate starting kVA
-    starting = calc_motor_starting_kva(motor_kw=largest_kw)
-    starting_kva = starting["starting_kva"]
+    # Calculate starting kVA (rounded as reported by calc_motor_starting_kva)
+    starting_kva = round(_starting_kva_scalar(largest_kw), 1)
 
     # Calculate voltage dip
     vdip = calc_voltage_dip_during_start(
@@ -303,6 +377,29 @@ def check_motor_starting(
     }
 
 
+def _upsize_for_motor_start(
+    starting_kva: float,
+    standard_sizes: tuple,
+    start_idx: int,
+    max_voltage_dip_pct: float
+) -> int:
+    """
+    Index of the first standard size from start_idx whose starting dip is acceptable.
+
+    Evaluates the dip (rounded to 0.1% as reported by check_motor_starting)
+    with typical impedance for each candidate size, without building result
+    dicts. Returns the largest size index if no size is acceptable.
+    """
+    last_idx = len(standard_sizes) - 1
+    idx = start_idx
+    while idx < last_idx:
+        kva = standard_sizes[idx]
+        if round(_vdip_scalar(starting_kva, kva, get_typical_impedance(kva)), 1) <= max_voltage_dip_pct:
+            break
+        idx += 1
+    return idx
+
+
 def size_transformer_with_motor_check(
     connected_kva: float,
     demand_kva: float,
@@ -333,30 +430,25 @@ def size_transformer_with_motor_check(
     )
     selected_kva = demand_sizing["selected_kva"]
 
-    # Check motor starting
-    motor_check = check_motor_starting(
-        motors, selected_kva, demand_sizing["typical_impedance_pct"]
-    )
-
     # If motor starting causes excessive dip, try larger transformer
     upsized = False
-    standard_sizes = ANSI_STANDARD_KVA if standard == "ANSI" else IEC_STANDARD_KVA
-
-    while motor_check["voltage_dip_pct"] > max_voltage_dip_pct:
-        # Try next size up
-        current_idx = standard_sizes.index(selected_kva) if selected_kva in standard_sizes else -1
-
-        if current_idx < len(standard_sizes) - 1:
-            selected_kva = standard_sizes[current_idx + 1]
+    if motors:
+        standard_sizes = _STANDARD_SIZES.get(standard, IEC_STANDARD_KVA)
+        start_idx = bisect.bisect_left(standard_sizes, selected_kva)
+        largest_kw, _ = _find_largest_motor(motors)
+        starting_kva = round(_starting_kva_scalar(largest_kw), 1)
+
+        final_idx = _upsize_for_motor_start(
+            starting_kva, standard_sizes, start_idx, max_voltage_dip_pct
+        )
+        if final_idx != start_idx:
+            selected_kva = standard_sizes[final_idx]
             upsized = True
 
-            # Recalculate motor starting check
-            motor_check = check_motor_starting(
-                motors, selected_kva, get_typical_impedance(selected_kva)
-            )
-        else:
-            # Can't upsize further
-            break
+    # Motor starting check at the final size
+    motor_check = check_motor_starting(
+        motors, selected_kva, get_typical_impedance(selected_kva)
+    )
 
     # Recalculate loading with final size
     loading_at_demand = (demand_kva / selected_kva) * 100
@@ -438,5 +530,14 @@ if __name__ == "__main__":
     print(f"   Largest motor dip: {result['motor_starting_check']['voltage_dip_pct']}%")
     print(f"   Sequential start required: {result['motor_starting_check']['sequential_start_required']}")
 
+    # Test batch sizing
+    print("\n5. Batch Transformer Sizing")
+    batch = size_transformers_batch(
+        connected_kva=[120, 450, 850, 2600],
+        demand_kva=[90, 300, 600, 2100]
+    )
+    for demand, kva, loading in zip(batch["demand_kva"], batch["selected_kva"], batch["loading_with_growth_pct"]):
+        print(f"   Demand {demand} kVA → {kva} kVA ({loading}% loading)")
+
     print("\n" + "=" * 60)
     print("All tests completed!")
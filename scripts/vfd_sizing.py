@@ -18,12 +18,20 @@ Author: Load List Skill
 Standards: NEC 2023 Article 430 Part X
 """
 
+import bisect
+import hashlib
 import math
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Literal
+from typing import Optional, Literal, Sequence
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 
 # Standard OCPD sizes per NEC 240.6
 STANDARD_OCPD_SIZES = [
@@ -33,9 +41,34 @@ STANDARD_OCPD_SIZES = [
     2500, 3000, 4000, 5000, 6000
 ]
 
+# NEC 430.52 maximum SCPD rating (% of motor FLC) by device type
+_SCPD_MAX_PCT = {
+    "dual_element_fuse": 175,
+    "inverse_time_cb": 250
+}
+
+# SCPD limiting-factor values reported as branch_scpd_limited_by
+_LIMITED_BY_VFD = "vfd_marking"
+_LIMITED_BY_NEC = "nec_430_52"
+
+# Typical assembly SCCR (kA) with current-limiting fuses, indexed by fuse class ID
+# (Actual values are manufacturer-specific, these are representative)
+_FUSE_CLASS_IDS = {"J": 0, "RK1": 1, "RK5": 2, "CC": 3, "T": 4}
+_FUSE_SCCR_ENHANCEMENT_KA = (
+    100,  # J - Class J can provide up to 200kA
+    65,   # RK1
+    50,   # RK5
+    50,   # CC
+    200   # T
+)
+
 # VFD catalog cache
 _VFD_CATALOG: Optional[dict] = None
 
+# Frame index built from the catalog:
+# (catalog key, frames key) -> (sorted kW lower bounds, [(kw_low, kw_high, frame name, frame specs)])
+_VFD_INDEX: Optional[dict] = None
+
 
 def load_vfd_catalog() -> dict:
     """Load VFD manufacturer catalog."""
@@ -44,13 +77,95 @@ def load_vfd_catalog() -> dict:
         catalogs_dir = Path(__file__).parent.parent / "catalogs"
         path = catalogs_dir / "vfd_catalog.yaml"
         if path.exists():
-            with open(path) as f:
-                _VFD_CATALOG = yaml.safe_load(f)
+            with open(path, "rb") as f:
+                source = f.read()
+            _VFD_CATALOG = _load_precompiled_vfd_catalog(hashlib.sha256(source).hexdigest())
+            if _VFD_CATALOG is None:
+                _VFD_CATALOG = yaml.load(source, Loader=_YamlLoader)
         else:
             _VFD_CATALOG = {}
     return _VFD_CATALOG
 
 
+def _load_precompiled_vfd_catalog(source_sha256: str) -> Optional[dict]:
+    """
+    Catalog from vfd_catalog_data.py (see build_catalog.py), if present and
+    built from the current YAML; None means parse the YAML instead.
+    """
+    try:
+        import vfd_catalog_data
+    except ImportError:
+        return None
+    # A stale or hand-edited module may lack either name
+    built_from = getattr(vfd_catalog_data, "SOURCE_SHA256", None)
+    catalog = getattr(vfd_catalog_data, "CATALOG", None)
+    if built_from is None or catalog is None or built_from != source_sha256:
+        return None
+    return catalog
+
+
+def _get_vfd_index() -> dict:
+    """Get cached frame index, building it from the catalog on first use."""
+    global _VFD_INDEX
+    if _VFD_INDEX is None:
+        _VFD_INDEX = _build_vfd_index(load_vfd_catalog())
+    return _VFD_INDEX
+
+
+def _build_vfd_index(catalog: dict) -> dict:
+    """
+    Index every frames section of the catalog by kW lower bound.
+
+    Handles both the dict format (frames keyed by frame name) and the older
+    list format, and normalizes each frame to a specs record keyed as in
+    lookup_vfd_catalog results, so lookups only ever see one shape. Frame
+    kW ranges within a section are assumed not to overlap.
+    """
+    index = {}
+    for key, vfd_data in catalog.items():
+        if not isinstance(vfd_data, dict):
+            continue
+        for frames_key, frames_section in vfd_data.items():
+            if not frames_key.startswith("frames_"):
+                continue
+
+            # Get frames - handle both old list format and new dict format
+            if isinstance(frames_section, dict):
+                frames = frames_section.get('frames', frames_section)
+            else:
+                frames = frames_section
+
+            if isinstance(frames, dict):
+                entries = [
+                    (name, data) for name, data in frames.items() if isinstance(data, dict)
+                ]
+            else:
+                entries = [(frame.get('frame'), frame) for frame in frames]
+
+            rows = []
+            for name, data in entries:
+                specs = _normalize_frame(data)
+                kw_range = specs["kw_range"]
+                rows.append((kw_range[0], kw_range[1], name, specs))
+            rows.sort(key=lambda row: row[0])
+
+            index[(key, frames_key)] = ([row[0] for row in rows], rows)
+    return index
+
+
+def _normalize_frame(frame_data: dict) -> dict:
+    """Frame specs from a catalog entry, with missing fields as None."""
+    return {
+        "kw_range": frame_data.get('kw_range', [0, 0]),
+        "rated_input_current_a": frame_data.get('rated_input_current'),
+        "rated_output_current_a": frame_data.get('rated_output_current'),
+        "max_branch_scpd_a": frame_data.get('max_branch_scpd_a'),
+        "recommended_fuse": frame_data.get('recommended_fuse'),
+        "losses_kw": frame_data.get('losses_kw'),
+        "sccr_ka": frame_data.get('sccr_ka')
+    }
+
+
 def calc_vfd_supply_conductor_ampacity(
     vfd_input_current: float,
     harmonic_derating: float = 1.0
@@ -69,27 +184,55 @@ def calc_vfd_supply_conductor_ampacity(
     Returns:
         dict with conductor sizing requirements
     """
-    # Base calculation per 430.122(A)
-    base_ampacity = 1.25 * vfd_input_current
-
-    # Apply harmonic derating if specified
-    min_ampacity = base_ampacity * harmonic_derating
+    min_ampacity, notes = _vfd_conductor_core(vfd_input_current, harmonic_derating)
 
     return {
-        "min_ampacity_a": round(min_ampacity, 1),
+        "min_ampacity_a": min_ampacity,
         "vfd_input_current_a": vfd_input_current,
         "multiplier": 1.25,
         "harmonic_derating": harmonic_derating,
         "code_reference": "NEC 430.122(A)",
-        "notes": (
-            f"VFD supply conductor ≥ 125% × VFD input current.\n"
-            f"125% × {vfd_input_current}A = {base_ampacity:.1f}A"
-            + (f"\nWith harmonic derating {harmonic_derating}: {min_ampacity:.1f}A"
-               if harmonic_derating != 1.0 else "")
-        )
+        "notes": notes
     }
 
 
+@lru_cache(maxsize=512, typed=True)
+def _vfd_conductor_core(vfd_input_current: float, harmonic_derating: float) -> tuple[float, str]:
+    """
+    Memoized NEC 430.122(A) ampacity and notes text.
+
+    Load lists repeat identical drives, so the arithmetic and note formatting
+    are done once per (input current, derating) pair. The cache is typed
+    because 207 and 207.0 format differently in the notes.
+
+    Returns:
+        (min_ampacity_a, notes)
+    """
+    min_ampacity, base_ampacity = _conductor_core(vfd_input_current, harmonic_derating)
+
+    notes = (
+        f"VFD supply conductor ≥ 125% × VFD input current.\n"
+        f"125% × {vfd_input_current}A = {base_ampacity:.1f}A"
+        + (f"\nWith harmonic derating {harmonic_derating}: {min_ampacity:.1f}A"
+           if harmonic_derating != 1.0 else "")
+    )
+    return round(min_ampacity, 1), notes
+
+
+def _conductor_core(vfd_input_current: float, harmonic_derating: float) -> tuple[float, float]:
+    """
+    NEC 430.122(A) conductor ampacity as plain floats.
+
+    Returns:
+        (min_ampacity_a, base_ampacity_a), unrounded
+    """
+    # Base calculation per 430.122(A)
+    base_ampacity = 1.25 * vfd_input_current
+
+    # Apply harmonic derating if specified
+    return base_ampacity * harmonic_derating, base_ampacity
+
+
 def calc_vfd_branch_scpd(
     motor_flc: float,
     vfd_input_current: float,
@@ -112,27 +255,9 @@ def calc_vfd_branch_scpd(
     Returns:
         dict with SCPD sizing
     """
-    # Calculate per 430.52 using motor FLC
-    if device_type == "dual_element_fuse":
-        max_pct = 175
-    else:  # inverse_time_cb
-        max_pct = 250
-
-    calculated_per_430_52 = motor_flc * (max_pct / 100)
-
-    # Apply next-size-up rule
-    max_per_nec = next((s for s in STANDARD_OCPD_SIZES if s >= calculated_per_430_52), calculated_per_430_52)
-
-    # VFD marking takes precedence if lower
-    if vfd_max_scpd:
-        max_rating = min(max_per_nec, vfd_max_scpd)
-        limited_by = "vfd_marking" if vfd_max_scpd < max_per_nec else "nec_430_52"
-    else:
-        max_rating = max_per_nec
-        limited_by = "nec_430_52"
-
-    # Select appropriate size (must carry VFD input current)
-    selected = next((s for s in STANDARD_OCPD_SIZES if s >= vfd_input_current and s <= max_rating), max_rating)
+    selected, max_per_nec, max_rating, limited_by, max_pct, calculated_per_430_52 = _scpd_core(
+        motor_flc, vfd_input_current, vfd_max_scpd, device_type
+    )
 
     return {
         "selected_rating_a": int(selected),
@@ -152,6 +277,50 @@ def calc_vfd_branch_scpd(
     }
 
 
+def _scpd_core(
+    motor_flc: float,
+    vfd_input_current: float,
+    vfd_max_scpd: Optional[float],
+    device_type: str
+) -> tuple[float, float, float, str, int, float]:
+    """
+    NEC 430.130 / 430.52 SCPD selection without building result text.
+
+    Returns:
+        (selected, max_per_nec, max_rating, limited_by, max_pct, calculated_per_430_52)
+    """
+    # Calculate per 430.52 using motor FLC
+    max_pct = _SCPD_MAX_PCT.get(device_type, _SCPD_MAX_PCT["inverse_time_cb"])
+
+    calculated_per_430_52 = motor_flc * (max_pct / 100)
+
+    # Apply next-size-up rule; hi counts the standard sizes <= max_rating
+    sizes = STANDARD_OCPD_SIZES
+    n_sizes = len(sizes)
+    i = bisect.bisect_left(sizes, calculated_per_430_52)
+    if i < n_sizes:
+        max_per_nec = sizes[i]
+        hi = i + 1
+    else:
+        max_per_nec = calculated_per_430_52
+        hi = n_sizes
+
+    # VFD marking takes precedence if lower
+    if vfd_max_scpd and vfd_max_scpd < max_per_nec:
+        max_rating = vfd_max_scpd
+        limited_by = _LIMITED_BY_VFD
+        hi = bisect.bisect_right(sizes, max_rating)
+    else:
+        max_rating = max_per_nec
+        limited_by = _LIMITED_BY_NEC
+
+    # Select appropriate size (must carry VFD input current)
+    lo = bisect.bisect_left(sizes, vfd_input_current)
+    selected = sizes[lo] if lo < hi else max_rating
+
+    return selected, max_per_nec, max_rating, limited_by, max_pct, calculated_per_430_52
+
+
 def lookup_vfd_catalog(
     manufacturer: str,
     series: str,
@@ -172,73 +341,38 @@ def lookup_vfd_catalog(
     Returns:
         VFD specifications dict or None if not found
     """
-    catalog = load_vfd_catalog()
+    index = _get_vfd_index()
 
     # Construct catalog key
     key = f"{manufacturer.lower()}_{series.lower()}"
-    if key not in catalog:
-        return None
-
-    vfd_data = catalog[key]
     frames_key = f"frames_{voltage_class.lower()}_{duty.lower()}"
 
-    if frames_key not in vfd_data:
+    section = index.get((key, frames_key))
+    if section is None:
         # Try without duty suffix
-        frames_key = f"frames_{voltage_class.lower()}"
-        if frames_key not in vfd_data:
+        section = index.get((key, f"frames_{voltage_class.lower()}"))
+        if section is None:
             return None
 
-    frames_section = vfd_data[frames_key]
+    # Find appropriate frame for motor kW
+    kw_lows, rows = section
+    i = bisect.bisect_right(kw_lows, motor_kw) - 1
+    if i < 0:
+        return None
 
-    # Get frames dict - handle both old list format and new dict format
-    if isinstance(frames_section, dict):
-        frames = frames_section.get('frames', frames_section)
-    else:
-        frames = frames_section
+    _, kw_high, frame_name, specs = rows[i]
+    if motor_kw > kw_high:
+        return None
 
-    # Find appropriate frame for motor kW
-    if isinstance(frames, dict):
-        # New dict format: frames keyed by frame name
-        for frame_name, frame_data in frames.items():
-            kw_range = frame_data.get('kw_range', [0, 0])
-            if kw_range[0] <= motor_kw <= kw_range[1]:
-                return {
-                    "manufacturer": manufacturer,
-                    "series": series,
-                    "frame": frame_name,
-                    "voltage_class": voltage_class,
-                    "duty": duty,
-                    "kw_range": kw_range,
-                    "rated_input_current_a": frame_data.get('rated_input_current'),
-                    "rated_output_current_a": frame_data.get('rated_output_current'),
-                    "max_branch_scpd_a": frame_data.get('max_branch_scpd_a'),
-                    "recommended_fuse": frame_data.get('recommended_fuse'),
-                    "losses_kw": frame_data.get('losses_kw'),
-                    "sccr_ka": frame_data.get('sccr_ka'),
-                    "source": "catalog"
-                }
-    else:
-        # Old list format
-        for frame in frames:
-            kw_range = frame.get('kw_range', [0, 0])
-            if kw_range[0] <= motor_kw <= kw_range[1]:
-                return {
-                    "manufacturer": manufacturer,
-                    "series": series,
-                    "frame": frame.get('frame'),
-                    "voltage_class": voltage_class,
-                    "duty": duty,
-                    "kw_range": kw_range,
-                    "rated_input_current_a": frame.get('rated_input_current'),
-                    "rated_output_current_a": frame.get('rated_output_current'),
-                    "max_branch_scpd_a": frame.get('max_branch_scpd_a'),
-                    "recommended_fuse": frame.get('recommended_fuse'),
-                    "losses_kw": frame.get('losses_kw'),
-                    "sccr_ka": frame.get('sccr_ka'),
-                    "source": "catalog"
-                }
-
-    return None
+    return {
+        "manufacturer": manufacturer,
+        "series": series,
+        "frame": frame_name,
+        "voltage_class": voltage_class,
+        "duty": duty,
+        **specs,
+        "source": "catalog"
+    }
 
 
 def estimate_vfd_input_current(
@@ -262,21 +396,71 @@ def estimate_vfd_input_current(
     Returns:
         dict with estimated VFD input current
     """
-    estimated_input = motor_flc * multiplier
+    estimated_input, notes = _estimate_vfd_input_core(motor_flc, multiplier)
 
     return {
-        "estimated_input_current_a": round(estimated_input, 1),
+        "estimated_input_current_a": estimated_input,
         "motor_flc_a": motor_flc,
         "multiplier": multiplier,
         "source": "estimate",
-        "notes": (
-            f"Estimated VFD input = {multiplier}× motor FLC.\n"
-            "Verify with actual VFD selection from manufacturer catalog."
-        ),
+        "notes": notes,
         "warning": "ESTIMATE ONLY - Use actual VFD catalog data when available"
     }
 
 
+@lru_cache(maxsize=512, typed=True)
+def _estimate_vfd_input_core(motor_flc: float, multiplier: float) -> tuple[float, str]:
+    """
+    Memoized VFD input current estimate and notes text.
+
+    Returns:
+        (estimated_input_current_a, notes)
+    """
+    notes = (
+        f"Estimated VFD input = {multiplier}× motor FLC.\n"
+        "Verify with actual VFD selection from manufacturer catalog."
+    )
+    return round(motor_flc * multiplier, 1), notes
+
+
+def _resolve_vfd_data(
+    motor_kw: float,
+    motor_flc: float,
+    voltage: float,
+    manufacturer: Optional[str],
+    series: Optional[str],
+    vfd_input_current: Optional[float],
+    vfd_max_scpd: Optional[float]
+) -> tuple[float, Optional[float], str, Optional[dict]]:
+    """
+    Resolve VFD input current and max SCPD (user data, then catalog, then estimate).
+
+    Returns:
+        (vfd_input_current, vfd_max_scpd, data_source, vfd_catalog_data)
+    """
+    vfd_data = None
+    data_source = "user_provided"
+
+    if vfd_input_current is None:
+        # Try catalog lookup
+        if manufacturer and series:
+            vfd_data = lookup_vfd_catalog(
+                manufacturer, series, motor_kw,
+                f"{int(voltage)}V"
+            )
+            if vfd_data:
+                vfd_input_current = vfd_data['rated_input_current_a']
+                vfd_max_scpd = vfd_data.get('max_branch_scpd_a') or vfd_max_scpd
+                data_source = "catalog"
+
+        # Fall back to estimation
+        if vfd_input_current is None:
+            vfd_input_current, _ = _estimate_vfd_input_core(motor_flc, 1.1)
+            data_source = "estimate"
+
+    return vfd_input_current, vfd_max_scpd, data_source, vfd_data
+
+
 def size_vfd_circuit(
     motor_kw: float,
     motor_flc: float,
@@ -286,7 +470,8 @@ def size_vfd_circuit(
     vfd_input_current: Optional[float] = None,
     vfd_max_scpd: Optional[float] = None,
     device_type: str = "dual_element_fuse",
-    harmonic_derating: float = 1.0
+    harmonic_derating: float = 1.0,
+    verbose: bool = False
 ) -> dict:
     """
     Complete VFD circuit sizing per NEC Part X.
@@ -306,37 +491,25 @@ def size_vfd_circuit(
         vfd_max_scpd: Override VFD max SCPD
         device_type: SCPD type
         harmonic_derating: Conductor harmonic derating factor
+        verbose: Include the full conductor_sizing / scpd_sizing dicts
+            (notes and sizing basis text)
 
     Returns:
         dict with complete VFD circuit sizing
     """
     # Determine VFD specifications
-    vfd_data = None
-    data_source = "user_provided"
-
-    if vfd_input_current is None:
-        # Try catalog lookup
-        if manufacturer and series:
-            vfd_data = lookup_vfd_catalog(
-                manufacturer, series, motor_kw,
-                f"{int(voltage)}V"
-            )
-            if vfd_data:
-                vfd_input_current = vfd_data['rated_input_current_a']
-                vfd_max_scpd = vfd_data.get('max_branch_scpd_a') or vfd_max_scpd
-                data_source = "catalog"
-
-        # Fall back to estimation
-        if vfd_input_current is None:
-            estimate = estimate_vfd_input_current(motor_flc, voltage)
-            vfd_input_current = estimate['estimated_input_current_a']
-            data_source = "estimate"
+    vfd_input_current, vfd_max_scpd, data_source, vfd_data = _resolve_vfd_data(
+        motor_kw, motor_flc, voltage, manufacturer, series,
+        vfd_input_current, vfd_max_scpd
+    )
 
     # Calculate conductor sizing
-    conductor = calc_vfd_supply_conductor_ampacity(vfd_input_current, harmonic_derating)
+    min_ampacity, _ = _conductor_core(vfd_input_current, harmonic_derating)
 
     # Calculate SCPD sizing
-    scpd = calc_vfd_branch_scpd(motor_flc, vfd_input_current, vfd_max_scpd, device_type)
+    selected, _, max_rating, limited_by, _, _ = _scpd_core(
+        motor_flc, vfd_input_current, vfd_max_scpd, device_type
+    )
 
     # Determine if VFD provides overload protection
     vfd_overload_integral = True  # Most modern VFDs do
@@ -353,25 +526,30 @@ def size_vfd_circuit(
         "vfd_overload_integral": vfd_overload_integral,
 
         # Conductor sizing (NEC 430.122)
-        "conductor_min_ampacity_a": conductor['min_ampacity_a'],
+        "conductor_min_ampacity_a": round(min_ampacity, 1),
 
         # SCPD sizing (NEC 430.130/430.52)
-        "branch_scpd_rating_a": scpd['selected_rating_a'],
-        "branch_scpd_max_a": scpd['max_effective_a'],
-        "branch_scpd_limited_by": scpd['limited_by'],
+        "branch_scpd_rating_a": int(selected),
+        "branch_scpd_max_a": int(max_rating),
+        "branch_scpd_limited_by": limited_by,
         "branch_scpd_type": device_type,
 
         # Overload (integral to VFD)
         "overload_type": "VFD_INTEGRAL",
         "overload_setting_a": motor_flc,  # Program VFD to motor nameplate
 
-        # Sizing basis
-        "conductor_sizing": conductor,
-        "scpd_sizing": scpd,
-
         "code_references": ["NEC 430.122", "NEC 430.130", "NEC 430.52"]
     }
 
+    # Sizing basis
+    if verbose:
+        result["conductor_sizing"] = calc_vfd_supply_conductor_ampacity(
+            vfd_input_current, harmonic_derating
+        )
+        result["scpd_sizing"] = calc_vfd_branch_scpd(
+            motor_flc, vfd_input_current, vfd_max_scpd, device_type
+        )
+
     # Add VFD catalog data if available
     if vfd_data:
         result["vfd_catalog_data"] = vfd_data
@@ -386,6 +564,79 @@ def size_vfd_circuit(
     return result
 
 
+def size_vfd_circuits_batch(
+    motor_kw: Sequence[float],
+    motor_flc: Sequence[float],
+    voltage: float = 400,
+    manufacturer: Optional[str] = None,
+    series: Optional[str] = None,
+    vfd_input_current: Optional[Sequence[Optional[float]]] = None,
+    vfd_max_scpd: Optional[Sequence[Optional[float]]] = None,
+    device_type: str = "dual_element_fuse",
+    harmonic_derating: float = 1.0
+) -> dict:
+    """
+    VFD circuit sizing for many motors on the same system.
+
+    Same method as size_vfd_circuit, but results are returned as parallel
+    lists (one entry per motor) and no per-motor dicts or sizing text are
+    built.
+
+    Args:
+        motor_kw: Motor power per motor (kW)
+        motor_flc: Motor FLC per motor from NEC tables
+        voltage: System voltage
+        manufacturer: VFD manufacturer for catalog lookup
+        series: VFD series for catalog lookup
+        vfd_input_current: Optional per-motor VFD input current overrides
+            (None entries fall back to catalog/estimate)
+        vfd_max_scpd: Optional per-motor VFD max SCPD overrides
+        device_type: SCPD type
+        harmonic_derating: Conductor harmonic derating factor
+
+    Returns:
+        dict of lists keyed like size_vfd_circuit results
+    """
+    n = len(motor_kw)
+    if len(motor_flc) != n:
+        raise ValueError("motor_kw and motor_flc must be the same length")
+    if vfd_input_current is None:
+        vfd_input_current = [None] * n
+    if vfd_max_scpd is None:
+        vfd_max_scpd = [None] * n
+
+    result = {
+        "motor_kw": list(motor_kw),
+        "motor_flc_a": list(motor_flc),
+        "vfd_input_current_a": [],
+        "vfd_max_scpd_a": [],
+        "vfd_data_source": [],
+        "conductor_min_ampacity_a": [],
+        "branch_scpd_rating_a": [],
+        "branch_scpd_max_a": [],
+        "branch_scpd_limited_by": [],
+        "voltage_v": voltage,
+        "branch_scpd_type": device_type
+    }
+
+    for kw, flc, vfd_in, vfd_max in zip(motor_kw, motor_flc, vfd_input_current, vfd_max_scpd):
+        vfd_in, vfd_max, data_source, _ = _resolve_vfd_data(
+            kw, flc, voltage, manufacturer, series, vfd_in, vfd_max
+        )
+        min_ampacity, _ = _conductor_core(vfd_in, harmonic_derating)
+        selected, _, max_rating, limited_by, _, _ = _scpd_core(flc, vfd_in, vfd_max, device_type)
+
+        result["vfd_input_current_a"].append(vfd_in)
+        result["vfd_max_scpd_a"].append(vfd_max)
+        result["vfd_data_source"].append(data_source)
+        result["conductor_min_ampacity_a"].append(round(min_ampacity, 1))
+        result["branch_scpd_rating_a"].append(int(selected))
+        result["branch_scpd_max_a"].append(int(max_rating))
+        result["branch_scpd_limited_by"].append(limited_by)
+
+    return result
+
+
 def get_vfd_sccr_with_fuse(
     vfd_base_sccr_ka: float,
     fuse_class: str,
@@ -405,17 +656,8 @@ def get_vfd_sccr_with_fuse(
     Returns:
         dict with enhanced SCCR rating
     """
-    # Typical SCCR enhancement with Class J fuses
-    # (Actual values are manufacturer-specific, these are representative)
-    fuse_sccr_enhancement = {
-        "J": 100,  # Class J can provide up to 200kA
-        "RK1": 65,
-        "RK5": 50,
-        "CC": 50,
-        "T": 200
-    }
-
-    enhanced_sccr = fuse_sccr_enhancement.get(fuse_class.upper(), vfd_base_sccr_ka)
+    fuse_id = _FUSE_CLASS_IDS.get(fuse_class.upper())
+    enhanced_sccr = vfd_base_sccr_ka if fuse_id is None else _FUSE_SCCR_ENHANCEMENT_KA[fuse_id]
     assembly_sccr = max(vfd_base_sccr_ka, enhanced_sccr)
 
     return {
@@ -432,6 +674,43 @@ def get_vfd_sccr_with_fuse(
     }
 
 
+def fuse_class_id(fuse_class: str) -> Optional[int]:
+    """
+    Integer ID for a fuse class, for use with get_vfd_sccr_with_fuse_batch.
+
+    Args:
+        fuse_class: Fuse class (J, RK1, etc.)
+
+    Returns:
+        Fuse class ID, or None if the class has no listed enhancement
+    """
+    return _FUSE_CLASS_IDS.get(fuse_class.upper())
+
+
+def get_vfd_sccr_with_fuse_batch(
+    vfd_base_sccr_ka: Sequence[float],
+    fuse_class_ids: Sequence[Optional[int]]
+) -> list[float]:
+    """
+    Assembly SCCR for many VFD/fuse combinations.
+
+    Same rating as get_vfd_sccr_with_fuse()["assembly_sccr_ka"]; a None
+    ID (unlisted fuse class) leaves the VFD base SCCR unchanged.
+
+    Args:
+        vfd_base_sccr_ka: VFD standalone SCCR per drive
+        fuse_class_ids: Fuse class IDs from fuse_class_id()
+
+    Returns:
+        Assembly SCCR (kA) per drive
+    """
+    enhancement = _FUSE_SCCR_ENHANCEMENT_KA
+    return [
+        base if fuse_id is None else max(base, enhancement[fuse_id])
+        for base, fuse_id in zip(vfd_base_sccr_ka, fuse_class_ids)
+    ]
+
+
 if __name__ == "__main__":
     print("Testing vfd_sizing module...")
     print("=" * 60)
@@ -492,6 +771,21 @@ if __name__ == "__main__":
     )
     print(f"   VFD base SCCR: {sccr['vfd_base_sccr_ka']} kA")
     print(f"   With Class J fuse: {sccr['assembly_sccr_ka']} kA")
+    batch_sccr = get_vfd_sccr_with_fuse_batch(
+        [22, 65, 22], [fuse_class_id(c) for c in ("J", "RK5", "L")]
+    )
+    print(f"   Batch (J, RK5, L): {batch_sccr} kA")
+
+    # Test batch sizing
+    print("\n7. Batch VFD Circuit Sizing")
+    batch = size_vfd_circuits_batch(
+        motor_kw=[7.5, 22, 110],
+        motor_flc=[15.2, 41, 195],
+        manufacturer="abb",
+        series="acs580"
+    )
+    for kw, scpd_a, source in zip(batch["motor_kw"], batch["branch_scpd_rating_a"], batch["vfd_data_source"]):
+        print(f"   {kw} kW: SCPD {scpd_a}A ({source})")
 
     print("\n" + "=" * 60)
     print("All tests completed!")
@@ -13,8 +13,10 @@ Author: Load List Skill
 Standards: NEC 210.19 Informational Note, IEC 60364-5-52
 """
 
+import bisect
 import math
-from typing import Optional
+from itertools import repeat
+from typing import Callable, Iterable, Optional, Sequence
 
 
 # Copper resistivity at different temperatures (Ω·mm²/m)
@@ -24,6 +26,8 @@ COPPER_RESISTIVITY = {
     75: 0.0221,
     90: 0.0236
 }
+_RHO_TEMPS = tuple(sorted(COPPER_RESISTIVITY))
+_RHO_VALUES = tuple(COPPER_RESISTIVITY[t] for t in _RHO_TEMPS)
 
 # Cable reactance (approximate, Ω/m)
 CABLE_REACTANCE = {
@@ -33,6 +37,203 @@ CABLE_REACTANCE = {
     "direct_buried": 0.00007
 }
 
+_SQRT3 = math.sqrt(3)
+
+# sin(φ) for the power factors used throughout the load list (motor running
+# and starting); other values are computed on demand
+_SINPHI_TABLE = {
+    pf: math.sqrt(1 - pf ** 2)
+    for pf in (0.20, 0.25, 0.30, 0.35, 0.80, 0.85, 0.90, 0.95, 1.0)
+}
+
+# AWG/kcmil to mm² conversion
+_AWG_TO_MM2 = {
+    "14 AWG": 2.08,
+    "12 AWG": 3.31,
+    "10 AWG": 5.26,
+    "8 AWG": 8.37,
+    "6 AWG": 13.30,
+    "4 AWG": 21.15,
+    "3 AWG": 26.67,
+    "2 AWG": 33.62,
+    "1 AWG": 42.41,
+    "1/0 AWG": 53.49,
+    "2/0 AWG": 67.43,
+    "3/0 AWG": 85.01,
+    "4/0 AWG": 107.2,
+    "250 kcmil": 126.7,
+    "300 kcmil": 152.0,
+    "350 kcmil": 177.3,
+    "400 kcmil": 202.7,
+    "500 kcmil": 253.4,
+    "600 kcmil": 304.0,
+    "700 kcmil": 354.7,
+    "750 kcmil": 380.0,
+    "800 kcmil": 405.4,
+    "900 kcmil": 456.0,
+    "1000 kcmil": 506.7
+}
+
+
+def _normalize_awg(cable_size_awg: str) -> str:
+    """Normalize an AWG/kcmil size string for lookup (case and spacing)."""
+    return " ".join(cable_size_awg.upper().split())
+
+
+# Lookup tables keyed on normalized size strings, built once at import.
+# Size IDs index _AWG_MM2_BY_ID for batch callers.
+_AWG_LOOKUP = {_normalize_awg(k): v for k, v in _AWG_TO_MM2.items()}
+_AWG_SIZE_ID = {_normalize_awg(k): i for i, k in enumerate(_AWG_TO_MM2)}
+_AWG_MM2_BY_ID = tuple(_AWG_TO_MM2.values())
+
+# Candidate conductor sizes for voltage drop sizing, ascending by area
+_METRIC_SIZING_SIZES = (
+    ("1.5 mm²", 1.5), ("2.5 mm²", 2.5), ("4 mm²", 4), ("6 mm²", 6),
+    ("10 mm²", 10), ("16 mm²", 16), ("25 mm²", 25), ("35 mm²", 35),
+    ("50 mm²", 50), ("70 mm²", 70), ("95 mm²", 95), ("120 mm²", 120),
+    ("150 mm²", 150), ("185 mm²", 185), ("240 mm²", 240), ("300 mm²", 300)
+)
+_AWG_SIZING_SIZES = (
+    ("14 AWG", 2.08), ("12 AWG", 3.31), ("10 AWG", 5.26), ("8 AWG", 8.37),
+    ("6 AWG", 13.30), ("4 AWG", 21.15), ("3 AWG", 26.67), ("2 AWG", 33.62),
+    ("1 AWG", 42.41), ("1/0 AWG", 53.49), ("2/0 AWG", 67.43), ("3/0 AWG", 85.01),
+    ("4/0 AWG", 107.2), ("250 kcmil", 126.7), ("300 kcmil", 152.0),
+    ("350 kcmil", 177.3), ("400 kcmil", 202.7), ("500 kcmil", 253.4)
+)
+# Voltage drop is reported to 0.01%; values further than this from a target
+# cannot change their pass/fail result when rounded
+_VD_ROUNDING_MARGIN = 0.0051
+
+_METRIC_SIZING_MM2 = tuple(mm2 for _, mm2 in _METRIC_SIZING_SIZES)
+_AWG_SIZING_MM2 = tuple(mm2 for _, mm2 in _AWG_SIZING_SIZES)
+
+
+def _vd_core(
+    current_a: float,
+    length_m: float,
+    cable_size_mm2: float,
+    voltage: float,
+    phases: int,
+    power_factor: float,
+    resistivity: float,
+    x_per_m: float
+) -> tuple[float, float, float]:
+    """
+    Numeric core of the voltage drop calculation.
+
+    Resistivity and reactance are resolved by the caller so that sweeps over
+    many circuits only pay for the arithmetic.
+
+    Returns:
+        (vd_volts, vd_pct, r_per_m)
+    """
+    # Calculate cable resistance per meter (one conductor)
+    r_per_m = resistivity / cable_size_mm2  # Ω/m
+
+    # Calculate impedance components
+    cos_phi = power_factor
+    sin_phi = _SINPHI_TABLE.get(cos_phi)
+    if sin_phi is None:
+        sin_phi = math.sqrt(1 - cos_phi ** 2)
+
+    # Effective impedance per meter
+    z_per_m = r_per_m * cos_phi + x_per_m * sin_phi
+
+    # Total cable length (outgoing path)
+    # For 3-phase balanced, we use √3 × I × L × Z
+    # For single-phase, we use 2 × I × L × Z (out and return)
+
+    if phases == 3:
+        vd_volts = _SQRT3 * current_a * length_m * z_per_m
+    else:
+        vd_volts = 2 * current_a * length_m * z_per_m
+
+    vd_pct = (vd_volts / voltage) * 100
+
+    return vd_volts, vd_pct, r_per_m
+
+
+def _copper_resistivity(temperature_c: float) -> float:
+    """
+    Copper resistivity (Ω·mm²/m) at a conductor temperature.
+
+    Table temperatures return the tabulated value; others are linearly
+    interpolated between neighbouring entries and clamped at the table ends.
+    """
+    rho = COPPER_RESISTIVITY.get(temperature_c)
+    if rho is not None:
+        return rho
+    i = bisect.bisect_right(_RHO_TEMPS, temperature_c)
+    if i == 0:
+        return _RHO_VALUES[0]
+    if i == len(_RHO_TEMPS):
+        return _RHO_VALUES[-1]
+    t0, t1 = _RHO_TEMPS[i - 1], _RHO_TEMPS[i]
+    r0, r1 = _RHO_VALUES[i - 1], _RHO_VALUES[i]
+    return r0 + (r1 - r0) * (temperature_c - t0) / (t1 - t0)
+
+
+def _vd_constants(
+    phases: int,
+    installation: str,
+    power_factor: float,
+    temperature_c: float
+) -> tuple[float, float, float, float]:
+    """
+    Circuit constants for voltage drop: (k, resistivity, x_per_m, sin_phi).
+
+    k is √3 for 3-phase and 2 for single-phase (out and return).
+    """
+    k = _SQRT3 if phases == 3 else 2
+    resistivity = _copper_resistivity(temperature_c)
+    x_per_m = CABLE_REACTANCE.get(installation, 0.00008)
+    sin_phi = _SINPHI_TABLE.get(power_factor)
+    if sin_phi is None:
+        sin_phi = math.sqrt(1 - power_factor ** 2)
+    return k, resistivity, x_per_m, sin_phi
+
+
+def make_vd_fn(
+    phases: int = 3,
+    installation: str = "conduit",
+    power_factor: float = 0.85,
+    temperature_c: float = 75
+) -> Callable[[float, float, float, float], float]:
+    """
+    Build a voltage drop function specialized for fixed circuit conditions.
+
+    Resistivity, reactance, sin(φ) and the phase factor are resolved once,
+    so the returned function only does the per-circuit arithmetic. Results
+    match calc_voltage_drop_pct for the same conditions.
+
+    Args:
+        phases: Number of phases (1 or 3)
+        installation: Installation type for reactance lookup
+        power_factor: Load power factor
+        temperature_c: Conductor operating temperature (°C)
+
+    Returns:
+        function (current_a, length_m, cable_size_mm2, voltage) -> voltage drop %
+    """
+    return _vd_fn_from_constants(
+        _vd_constants(phases, installation, power_factor, temperature_c), power_factor
+    )
+
+
+def _vd_fn_from_constants(
+    constants: tuple[float, float, float, float],
+    power_factor: float
+) -> Callable[[float, float, float, float], float]:
+    """make_vd_fn for constants already resolved by _vd_constants."""
+    k, resistivity, x_per_m, sin_phi = constants
+    x_sin_phi = x_per_m * sin_phi
+
+    def vd_pct(current_a: float, length_m: float, cable_size_mm2: float, voltage: float) -> float:
+        z_per_m = resistivity / cable_size_mm2 * power_factor + x_sin_phi
+        return (k * current_a * length_m * z_per_m / voltage) * 100
+
+    return vd_pct
+
 
 def calc_voltage_drop_pct(
     current_a: float,
@@ -67,31 +268,15 @@ def calc_voltage_drop_pct(
         dict with voltage drop results
     """
     # Get copper resistivity at operating temperature
-    resistivity = COPPER_RESISTIVITY.get(temperature_c, COPPER_RESISTIVITY[75])
-
-    # Calculate cable resistance per meter (one conductor)
-    r_per_m = resistivity / cable_size_mm2  # Ω/m
+    resistivity = _copper_resistivity(temperature_c)
 
     # Get reactance (small for LV cables, but included for completeness)
     x_per_m = CABLE_REACTANCE.get(installation, 0.00008)  # Ω/m
 
-    # Calculate impedance components
-    cos_phi = power_factor
-    sin_phi = math.sqrt(1 - cos_phi ** 2)
-
-    # Effective impedance per meter
-    z_per_m = r_per_m * cos_phi + x_per_m * sin_phi
-
-    # Total cable length (outgoing path)
-    # For 3-phase balanced, we use √3 × I × L × Z
-    # For single-phase, we use 2 × I × L × Z (out and return)
-
-    if phases == 3:
-        vd_volts = math.sqrt(3) * current_a * length_m * z_per_m
-    else:
-        vd_volts = 2 * current_a * length_m * z_per_m
-
-    vd_pct = (vd_volts / voltage) * 100
+    vd_volts, vd_pct, r_per_m = _vd_core(
+        current_a, length_m, cable_size_mm2, voltage, phases, power_factor,
+        resistivity, x_per_m
+    )
 
     return {
         "voltage_drop_v": round(vd_volts, 2),
@@ -112,6 +297,106 @@ def calc_voltage_drop_pct(
     }
 
 
+def _vd_pct_list(
+    currents_a: Iterable[float],
+    lengths_m: Iterable[float],
+    cable_sizes_mm2: Iterable[float],
+    voltages: Iterable[float],
+    power_factors: Iterable[float],
+    phases: int,
+    temperature_c: float,
+    installation: str
+) -> list[float]:
+    """Shared loop for the batch and sweep APIs; lengths are checked by the caller."""
+    resistivity = _copper_resistivity(temperature_c)
+    x_per_m = CABLE_REACTANCE.get(installation, 0.00008)
+
+    return [
+        _vd_core(i, l, a, v, phases, pf, resistivity, x_per_m)[1]
+        for i, l, a, v, pf in zip(currents_a, lengths_m, cable_sizes_mm2, voltages, power_factors)
+    ]
+
+
+def calc_voltage_drop_batch(
+    currents_a: Sequence[float],
+    lengths_m: Sequence[float],
+    cable_sizes_mm2: Sequence[float],
+    voltage: float,
+    phases: int = 3,
+    power_factor: float = 0.85,
+    temperature_c: float = 75,
+    installation: str = "conduit"
+) -> list[float]:
+    """
+    Voltage drop percentage for many circuits on the same system.
+
+    Intended for load-list sheets with hundreds of circuits; returns
+    unrounded percentages only (no per-circuit result dicts).
+
+    Args:
+        currents_a: Load current per circuit (A)
+        lengths_m: One-way cable length per circuit (m)
+        cable_sizes_mm2: Conductor cross-section per circuit (mm²)
+        voltage: System voltage (line-to-line for 3-phase)
+        phases: Number of phases (1 or 3)
+        power_factor: Load power factor
+        temperature_c: Conductor operating temperature (°C)
+        installation: Installation type for reactance lookup
+
+    Returns:
+        list of voltage drop percentages, one per circuit
+    """
+    if not len(currents_a) == len(lengths_m) == len(cable_sizes_mm2):
+        raise ValueError("currents_a, lengths_m and cable_sizes_mm2 must be the same length")
+
+    return _vd_pct_list(
+        currents_a, lengths_m, cable_sizes_mm2, repeat(voltage), repeat(power_factor),
+        phases, temperature_c, installation
+    )
+
+
+def calc_voltage_drop_sweep(
+    currents_a: Sequence[float],
+    lengths_m: Sequence[float],
+    cable_sizes_mm2: Sequence[float],
+    voltages: Sequence[float],
+    power_factors: Sequence[float],
+    phases: int = 3,
+    temperature_c: float = 75,
+    installation: str = "conduit"
+) -> list[float]:
+    """
+    Voltage drop percentage for circuits across a whole plant.
+
+    Like calc_voltage_drop_batch, but voltage and power factor are given per
+    circuit so feeders and branches on different systems can be swept together.
+
+    Args:
+        currents_a: Load current per circuit (A)
+        lengths_m: One-way cable length per circuit (m)
+        cable_sizes_mm2: Conductor cross-section per circuit (mm²)
+        voltages: System voltage per circuit (line-to-line for 3-phase)
+        power_factors: Load power factor per circuit
+        phases: Number of phases (1 or 3)
+        temperature_c: Conductor operating temperature (°C)
+        installation: Installation type for reactance lookup
+
+    Returns:
+        list of voltage drop percentages, one per circuit
+    """
+    if not (len(currents_a) == len(lengths_m) == len(cable_sizes_mm2)
+            == len(voltages) == len(power_factors)):
+        raise ValueError(
+            "currents_a, lengths_m, cable_sizes_mm2, voltages and power_factors "
+            "must be the same length"
+        )
+
+    return _vd_pct_list(
+        currents_a, lengths_m, cable_sizes_mm2, voltages, power_factors,
+        phases, temperature_c, installation
+    )
+
+
 def calc_voltage_drop_from_awg(
     current_a: float,
     length_m: float,
@@ -134,35 +419,7 @@ def calc_voltage_drop_from_awg(
     Returns:
         dict with voltage drop results
     """
-    # AWG to mm² conversion
-    awg_to_mm2 = {
-        "14 AWG": 2.08,
-        "12 AWG": 3.31,
-        "10 AWG": 5.26,
-        "8 AWG": 8.37,
-        "6 AWG": 13.30,
-        "4 AWG": 21.15,
-        "3 AWG": 26.67,
-        "2 AWG": 33.62,
-        "1 AWG": 42.41,
-        "1/0 AWG": 53.49,
-        "2/0 AWG": 67.43,
-        "3/0 AWG": 85.01,
-        "4/0 AWG": 107.2,
-        "250 kcmil": 126.7,
-        "300 kcmil": 152.0,
-        "350 kcmil": 177.3,
-        "400 kcmil": 202.7,
-        "500 kcmil": 253.4,
-        "600 kcmil": 304.0,
-        "700 kcmil": 354.7,
-        "750 kcmil": 380.0,
-        "800 kcmil": 405.4,
-        "900 kcmil": 456.0,
-        "1000 kcmil": 506.7
-    }
-
-    cable_size_mm2 = awg_to_mm2.get(cable_size_awg.upper().replace("  ", " "))
+    cable_size_mm2 = _AWG_LOOKUP.get(_normalize_awg(cable_size_awg))
     if cable_size_mm2 is None:
         return {"error": f"Unknown cable size: {cable_size_awg}"}
 
@@ -173,6 +430,58 @@ def calc_voltage_drop_from_awg(
     return result
 
 
+def awg_size_id(cable_size_awg: str) -> Optional[int]:
+    """
+    Integer ID for an AWG/kcmil size, for use with calc_voltage_drop_from_awg_ids.
+
+    Args:
+        cable_size_awg: Cable size in AWG or kcmil (e.g., "4 AWG", "250 kcmil")
+
+    Returns:
+        Size ID, or None if the size is unknown
+    """
+    return _AWG_SIZE_ID.get(_normalize_awg(cable_size_awg))
+
+
+def calc_voltage_drop_from_awg_ids(
+    currents_a: Sequence[float],
+    lengths_m: Sequence[float],
+    size_ids: Sequence[int],
+    voltage: float,
+    phases: int = 3,
+    power_factor: float = 0.85
+) -> list[float]:
+    """
+    Voltage drop percentage for many circuits sized in AWG/kcmil.
+
+    Sizes are given as IDs from awg_size_id, so no string handling is done
+    per circuit.
+
+    Args:
+        currents_a: Load current per circuit (A)
+        lengths_m: One-way cable length per circuit (m)
+        size_ids: AWG/kcmil size ID per circuit
+        voltage: System voltage
+        phases: Number of phases
+        power_factor: Load power factor
+
+    Returns:
+        list of voltage drop percentages, one per circuit
+
+    Raises:
+        ValueError: If a size ID is not one returned by awg_size_id
+    """
+    n_sizes = len(_AWG_MM2_BY_ID)
+    for pos, size_id in enumerate(size_ids):
+        if not isinstance(size_id, int) or not 0 <= size_id < n_sizes:
+            raise ValueError(f"Unknown cable size ID at position {pos}: {size_id!r}")
+
+    return calc_voltage_drop_batch(
+        currents_a, lengths_m, [_AWG_MM2_BY_ID[i] for i in size_ids],
+        voltage, phases, power_factor
+    )
+
+
 def calc_motor_starting_voltage_drop(
     motor_lra: float,
     length_m: float,
@@ -234,6 +543,53 @@ def calc_motor_starting_voltage_drop(
     return result
 
 
+def _vd_size_index(
+    current_a: float,
+    length_m: float,
+    voltage: float,
+    target_vd_pct: float,
+    power_factor: float,
+    sizes_mm2: tuple,
+    constants: tuple[float, float, float, float],
+    vd_pct_fn: Callable[[float, float, float, float], float]
+) -> int:
+    """
+    Index of the smallest size in sizes_mm2 meeting the voltage drop target.
+
+    Returns len(sizes_mm2) if no size meets it.
+    """
+    k, resistivity, x_per_m, sin_phi = constants
+
+    # Solve Vd% = target for the minimum conductor area:
+    # target/100 × V = k × I × L × (ρ/A × cos(φ) + X × sin(φ))
+    vd_allowed = target_vd_pct / 100 * voltage
+    vd_resistive = vd_allowed - k * current_a * length_m * x_per_m * sin_phi
+
+    if vd_resistive > 0:
+        min_mm2 = k * current_a * length_m * resistivity * power_factor / vd_resistive
+        idx = bisect.bisect_left(sizes_mm2, min_mm2)
+    else:
+        idx = len(sizes_mm2)  # Reactance alone exceeds the target
+
+    # The target is checked against the reported (rounded) voltage drop, so
+    # settle the analytical index against it before reporting. Only the
+    # numeric core is evaluated; no result dicts or notes are built, and
+    # round() is only needed within half a display step of the target.
+    def meets_target(i):
+        vd_pct = vd_pct_fn(current_a, length_m, sizes_mm2[i], voltage)
+        if vd_pct < target_vd_pct - _VD_ROUNDING_MARGIN:
+            return True
+        if vd_pct > target_vd_pct + _VD_ROUNDING_MARGIN:
+            return False
+        return round(vd_pct, 2) <= target_vd_pct
+
+    while idx > 0 and meets_target(idx - 1):
+        idx -= 1
+    while idx < len(sizes_mm2) and not meets_target(idx):
+        idx += 1
+    return idx
+
+
 def size_cable_for_voltage_drop(
     current_a: float,
     length_m: float,
@@ -259,37 +615,31 @@ def size_cable_for_voltage_drop(
         dict with minimum cable size
     """
     if cable_standard.lower() == "awg":
-        sizes = [
-            ("14 AWG", 2.08), ("12 AWG", 3.31), ("10 AWG", 5.26), ("8 AWG", 8.37),
-            ("6 AWG", 13.30), ("4 AWG", 21.15), ("3 AWG", 26.67), ("2 AWG", 33.62),
-            ("1 AWG", 42.41), ("1/0 AWG", 53.49), ("2/0 AWG", 67.43), ("3/0 AWG", 85.01),
-            ("4/0 AWG", 107.2), ("250 kcmil", 126.7), ("300 kcmil", 152.0),
-            ("350 kcmil", 177.3), ("400 kcmil", 202.7), ("500 kcmil", 253.4)
-        ]
+        sizes, sizes_mm2 = _AWG_SIZING_SIZES, _AWG_SIZING_MM2
     else:
-        sizes = [
-            ("1.5 mm²", 1.5), ("2.5 mm²", 2.5), ("4 mm²", 4), ("6 mm²", 6),
-            ("10 mm²", 10), ("16 mm²", 16), ("25 mm²", 25), ("35 mm²", 35),
-            ("50 mm²", 50), ("70 mm²", 70), ("95 mm²", 95), ("120 mm²", 120),
-            ("150 mm²", 150), ("185 mm²", 185), ("240 mm²", 240), ("300 mm²", 300)
-        ]
-
-    for size_name, size_mm2 in sizes:
-        result = calc_voltage_drop_pct(
-            current_a, length_m, size_mm2, voltage, phases, power_factor
-        )
-        if result["voltage_drop_pct"] <= target_vd_pct:
-            return {
-                "selected_size": size_name,
-                "selected_size_mm2": size_mm2,
-                "voltage_drop_pct": result["voltage_drop_pct"],
-                "target_vd_pct": target_vd_pct,
-                "current_a": current_a,
-                "length_m": length_m,
-                "voltage_v": voltage,
-                "cable_standard": cable_standard,
-                "meets_target": True
-            }
+        sizes, sizes_mm2 = _METRIC_SIZING_SIZES, _METRIC_SIZING_MM2
+
+    # Same conductor basis as calc_voltage_drop_pct defaults (75°C, conduit)
+    constants = _vd_constants(phases, "conduit", power_factor, 75)
+    vd_pct_fn = _vd_fn_from_constants(constants, power_factor)
+    idx = _vd_size_index(
+        current_a, length_m, voltage, target_vd_pct, power_factor,
+        sizes_mm2, constants, vd_pct_fn
+    )
+
+    if idx < len(sizes_mm2):
+        size_name, size_mm2 = sizes[idx]
+        return {
+            "selected_size": size_name,
+            "selected_size_mm2": size_mm2,
+            "voltage_drop_pct": round(vd_pct_fn(current_a, length_m, size_mm2, voltage), 2),
+            "target_vd_pct": target_vd_pct,
+            "current_a": current_a,
+            "length_m": length_m,
+            "voltage_v": voltage,
+            "cable_standard": cable_standard,
+            "meets_target": True
+        }
 
     return {
         "selected_size": "Exceeds available sizes",
@@ -301,6 +651,71 @@ def size_cable_for_voltage_drop(
     }
 
 
+def size_cables_for_voltage_drop_batch(
+    currents_a: Sequence[float],
+    lengths_m: Sequence[float],
+    voltage: float,
+    target_vd_pct: float = 3.0,
+    phases: int = 3,
+    power_factor: float = 0.85,
+    cable_standard: str = "metric"
+) -> dict:
+    """
+    Minimum cable size meeting a voltage drop target for many circuits.
+
+    Same selection as size_cable_for_voltage_drop; conductor constants and
+    the size table are resolved once for the whole batch.
+
+    Args:
+        currents_a: Load current per circuit (A)
+        lengths_m: Cable length per circuit (m)
+        voltage: System voltage
+        target_vd_pct: Target voltage drop percentage
+        phases: Number of phases
+        power_factor: Power factor
+        cable_standard: "metric" (mm²) or "awg"
+
+    Returns:
+        dict of lists: selected_size, selected_size_mm2, voltage_drop_pct and
+        meets_target, one entry per circuit (size fields None if no size meets
+        the target)
+    """
+    if len(currents_a) != len(lengths_m):
+        raise ValueError("currents_a and lengths_m must be the same length")
+
+    if cable_standard.lower() == "awg":
+        sizes, sizes_mm2 = _AWG_SIZING_SIZES, _AWG_SIZING_MM2
+    else:
+        sizes, sizes_mm2 = _METRIC_SIZING_SIZES, _METRIC_SIZING_MM2
+
+    constants = _vd_constants(phases, "conduit", power_factor, 75)
+    vd_pct_fn = _vd_fn_from_constants(constants, power_factor)
+    n_sizes = len(sizes_mm2)
+
+    result = {
+        "selected_size": [],
+        "selected_size_mm2": [],
+        "voltage_drop_pct": [],
+        "meets_target": []
+    }
+    for current_a, length_m in zip(currents_a, lengths_m):
+        idx = _vd_size_index(
+            current_a, length_m, voltage, target_vd_pct, power_factor,
+            sizes_mm2, constants, vd_pct_fn
+        )
+        if idx < n_sizes:
+            size_name, size_mm2 = sizes[idx]
+            vd_pct = round(vd_pct_fn(current_a, length_m, size_mm2, voltage), 2)
+        else:
+            size_name = size_mm2 = vd_pct = None
+        result["selected_size"].append(size_name)
+        result["selected_size_mm2"].append(size_mm2)
+        result["voltage_drop_pct"].append(vd_pct)
+        result["meets_target"].append(idx < n_sizes)
+
+    return result
+
+
 def calc_total_voltage_drop(
     feeder_vd_pct: float,
     branch_vd_pct: float
@@ -336,6 +751,34 @@ def calc_total_voltage_drop(
     }
 
 
+def calc_total_voltage_drop_batch(
+    feeder_vd_pct: Sequence[float],
+    branch_vd_pct: Sequence[float]
+) -> dict:
+    """
+    Total voltage drop (feeder + branch) for many circuits.
+
+    Same totals and NEC 5% check as calc_total_voltage_drop, without the
+    per-circuit notes.
+
+    Args:
+        feeder_vd_pct: Feeder voltage drop percentage per circuit
+        branch_vd_pct: Branch circuit voltage drop percentage per circuit
+
+    Returns:
+        dict of lists: total_vd_pct (rounded) and compliant, one entry per circuit
+    """
+    if len(feeder_vd_pct) != len(branch_vd_pct):
+        raise ValueError("feeder_vd_pct and branch_vd_pct must be the same length")
+
+    totals = [f + b for f, b in zip(feeder_vd_pct, branch_vd_pct)]
+    return {
+        "total_vd_pct": [round(t, 2) for t in totals],
+        "compliant": [t <= 5.0 for t in totals],
+        "target_max_pct": 5.0
+    }
+
+
 if __name__ == "__main__":
     print("Testing voltage_drop module...")
     print("=" * 60)
@@ -400,5 +843,28 @@ if __name__ == "__main__":
     print(f"   Total: {result['total_vd_pct']}%")
     print(f"   Compliant (≤5%): {result['compliant']}")
 
+    # Test batch voltage drop
+    print("\n6. Batch Voltage Drop (400V, 3-phase)")
+    circuits = [(30, 40, 6), (65, 80, 16), (150, 120, 70)]
+    vds = calc_voltage_drop_batch(
+        [c[0] for c in circuits], [c[1] for c in circuits], [c[2] for c in circuits], 400
+    )
+    for (amps, length, mm2), vd in zip(circuits, vds):
+        print(f"   {amps}A, {length}m, {mm2}mm²: {vd:.2f}%")
+
+    # Test plant-wide sweep with totals
+    print("\n7. Plant Voltage Drop Sweep (feeder + branch)")
+    feeders = calc_voltage_drop_sweep([400, 250], [60, 90], [240, 150], [400, 480], [0.9, 0.85])
+    branches = calc_voltage_drop_sweep([65, 42], [80, 150], [16, 10], [400, 480], [0.85, 0.85])
+    totals = calc_total_voltage_drop_batch(feeders, branches)
+    for total, ok in zip(totals["total_vd_pct"], totals["compliant"]):
+        print(f"   Total: {total}%  Compliant (≤5%): {ok}")
+
+    # Test batch cable sizing
+    print("\n8. Batch Cable Sizing for ≤3% (400V, 3-phase)")
+    sized = size_cables_for_voltage_drop_batch([30, 150, 400], [40, 100, 250], 400)
+    for size, vd in zip(sized["selected_size"], sized["voltage_drop_pct"]):
+        print(f"   Selected: {size}  VD: {vd}%" if size else "   Exceeds available sizes")
+
     print("\n" + "=" * 60)
     print("All tests completed!")
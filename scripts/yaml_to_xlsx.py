@@ -22,19 +22,31 @@ Version: 2.0.0
 """
 
 import argparse
+import datetime
 import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional
+from zipfile import ZipFile, ZIP_DEFLATED, ZIP_STORED
 
 import yaml
 
 try:
-    from openpyxl import Workbook
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    from openpyxl import Workbook, __version__ as OPENPYXL_VERSION
     from openpyxl.styles import (
         Font, Alignment, Border, Side, PatternFill, NamedStyle
     )
+    from openpyxl.cell import WriteOnlyCell
     from openpyxl.utils import get_column_letter
     from openpyxl.worksheet.table import Table, TableStyleInfo
+    from openpyxl.writer.excel import ExcelWriter
 except ImportError:
     print("Error: openpyxl is required. Install with: pip install openpyxl")
     sys.exit(1)
@@ -188,87 +200,103 @@ KEY_ALIASES = {
 }
 
 
+def _alias_getter(alt_key: str):
+    """Getter for an alternate key; dotted keys walk nested dicts."""
+    if "." not in alt_key:
+        return lambda item: item.get(alt_key, "")
+
+    parts = tuple(alt_key.split("."))
+
+    def getter(item):
+        # Missing keys raise KeyError, non-dict hops TypeError
+        try:
+            for part in parts:
+                item = item[part]
+            return item
+        except (KeyError, TypeError):
+            return ""
+
+    return getter
+
+
+# KEY_ALIASES with each alternate key compiled to a getter(item) -> value
+_COMPILED_ALIASES = {
+    key: tuple(_alias_getter(alt_key) for alt_key in alt_keys)
+    for key, alt_keys in KEY_ALIASES.items()
+}
+
+
 # =============================================================================
 # STYLES
 # =============================================================================
 
-def create_styles(wb: Workbook) -> dict:
-    """Create and register named styles."""
-    styles = {}
+# Style components, built once at import and shared by every workbook's
+# named styles. They are never mutated; workbooks index them by value.
+_FONT_9 = Font(size=9)
+_ALIGN_CENTER = Alignment(vertical="center")
+_ALIGN_RIGHT = Alignment(horizontal="right", vertical="center")
+_THIN_BOTTOM = Border(bottom=Side(style="thin", color="000000"))
 
+# (name, font, fill, alignment, border, number format) per named style
+_NAMED_STYLE_SPECS = (
     # Header style
-    header = NamedStyle(name="header")
-    header.font = Font(bold=True, color="FFFFFF", size=10)
-    header.fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-    header.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-    header.border = Border(
-        bottom=Side(style="thin", color="000000")
-    )
-    wb.add_named_style(header)
-    styles["header"] = header
-
+    ("header", Font(bold=True, color="FFFFFF", size=10),
+     PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid"),
+     Alignment(horizontal="center", vertical="center", wrap_text=True),
+     _THIN_BOTTOM, None),
     # Data style
-    data = NamedStyle(name="data")
-    data.font = Font(size=9)
-    data.alignment = Alignment(vertical="center")
-    wb.add_named_style(data)
-    styles["data"] = data
-
+    ("data", _FONT_9, None, _ALIGN_CENTER, None, None),
     # Number style
-    number = NamedStyle(name="number")
-    number.font = Font(size=9)
-    number.alignment = Alignment(horizontal="right", vertical="center")
-    number.number_format = "#,##0.0"
-    wb.add_named_style(number)
-    styles["number"] = number
-
+    ("number", _FONT_9, None, _ALIGN_RIGHT, None, "#,##0.0"),
     # Integer style
-    integer = NamedStyle(name="integer")
-    integer.font = Font(size=9)
-    integer.alignment = Alignment(horizontal="right", vertical="center")
-    integer.number_format = "#,##0"
-    wb.add_named_style(integer)
-    styles["integer"] = integer
-
+    ("integer", _FONT_9, None, _ALIGN_RIGHT, None, "#,##0"),
     # Percent style
-    percent = NamedStyle(name="percent")
-    percent.font = Font(size=9)
-    percent.alignment = Alignment(horizontal="right", vertical="center")
-    percent.number_format = "0.0%"
-    wb.add_named_style(percent)
-    styles["percent"] = percent
-
+    ("percent", _FONT_9, None, _ALIGN_RIGHT, None, "0.0%"),
     # Title style
-    title = NamedStyle(name="title")
-    title.font = Font(bold=True, size=14)
-    title.alignment = Alignment(horizontal="left", vertical="center")
-    wb.add_named_style(title)
-    styles["title"] = title
-
+    ("title", Font(bold=True, size=14), None,
+     Alignment(horizontal="left", vertical="center"), None, None),
     # Subtotal style
-    subtotal = NamedStyle(name="subtotal")
-    subtotal.font = Font(bold=True, size=9)
-    subtotal.fill = PatternFill(start_color="E2EFDA", end_color="E2EFDA", fill_type="solid")
-    subtotal.alignment = Alignment(vertical="center")
-    wb.add_named_style(subtotal)
-    styles["subtotal"] = subtotal
-
+    ("subtotal", Font(bold=True, size=9),
+     PatternFill(start_color="E2EFDA", end_color="E2EFDA", fill_type="solid"),
+     _ALIGN_CENTER, None, None),
     # Warning style (for non-compliant values)
-    warning = NamedStyle(name="warning")
-    warning.font = Font(size=9, color="C00000")
-    warning.alignment = Alignment(horizontal="right", vertical="center")
-    warning.fill = PatternFill(start_color="FFCCCC", end_color="FFCCCC", fill_type="solid")
-    wb.add_named_style(warning)
-    styles["warning"] = warning
-
+    ("warning", Font(size=9, color="C00000"),
+     PatternFill(start_color="FFCCCC", end_color="FFCCCC", fill_type="solid"),
+     _ALIGN_RIGHT, None, None),
     # Assumed style (for estimated values)
-    assumed = NamedStyle(name="assumed")
-    assumed.font = Font(size=9, italic=True)
-    assumed.alignment = Alignment(vertical="center")
-    assumed.fill = PatternFill(start_color="FFF2CC", end_color="FFF2CC", fill_type="solid")
-    wb.add_named_style(assumed)
-    styles["assumed"] = assumed
+    ("assumed", Font(size=9, italic=True),
+     PatternFill(start_color="FFF2CC", end_color="FFF2CC", fill_type="solid"),
+     _ALIGN_CENTER, None, None),
+)
 
+
+# Styles an output without any load data still uses: the Load List
+# header row and the Notes sheet
+_BASE_STYLE_NAMES = ("header", "data", "title")
+
+
+def create_styles(wb: Workbook, names: Iterable[str] = None) -> dict:
+    """
+    Register the named styles with a workbook.
+
+    Registering binds a NamedStyle to its workbook, so each workbook gets
+    its own NamedStyle objects; only the font/fill/alignment/border
+    components are shared.
+
+    Args:
+        wb: Workbook to register with
+        names: Only register these styles (default all)
+    """
+    styles = {}
+    for name, font, fill, alignment, border, number_format in _NAMED_STYLE_SPECS:
+        if names is not None and name not in names:
+            continue
+        style = NamedStyle(
+            name=name, font=font, fill=fill, alignment=alignment,
+            border=border, number_format=number_format
+        )
+        wb.add_named_style(style)
+        styles[name] = style
     return styles
 
 
@@ -276,151 +304,285 @@ def create_styles(wb: Workbook) -> dict:
 # SHEET WRITERS
 # =============================================================================
 
-def write_generic_sheet(ws, data: list[dict], columns: list, styles: dict,
-                        title: str = None, add_totals: list = None):
-    """Generic sheet writer with column definitions."""
-    ws.title = title[:31] if title else "Data"  # Excel max 31 chars
+def _format_value(value) -> tuple:
+    """
+    Default cell formatting: (value, style name, number format).
+
+    Text is interned: tags, panels, starter types and the like repeat on
+    thousands of rows, and one object per distinct string keeps the shared
+    strings lookup in the --fast-xml writer to an identity check.
+    """
+    if isinstance(value, bool):
+        return "Yes" if value else "No", "data", None
+    if isinstance(value, int):
+        return value, "integer", None
+    if isinstance(value, float):
+        return value, "number", None
+    if isinstance(value, list):
+        return sys.intern(", ".join(str(v) for v in value)), "data", None
+    return sys.intern(str(value)) if value else "", "data", None
+
+
+def _format_two_decimals(value) -> tuple:
+    return value if value else 0, None, "0.00"
+
+
+def _format_one_decimal(value) -> tuple:
+    return value if value else 0, None, "0.0"
+
+
+def _format_length_assumed(value) -> tuple:
+    return ("Yes", "assumed", None) if value else _format_value(value)
+
+
+def _format_vd_compliant(value) -> tuple:
+    return ("Yes", "data", None) if value else ("No", "warning", None)
+
+
+# Column keys with special formatting; all others use _format_value
+_COLUMN_FORMATTERS = {
+    "load_factor": _format_two_decimals,
+    "diversity_factor": _format_two_decimals,
+    "pf": _format_two_decimals,
+    "impedance_pct": _format_two_decimals,
+    "efficiency_pct": _format_one_decimal,
+    "loading_pct": _format_one_decimal,
+    "spare_capacity_pct": _format_one_decimal,
+    "voltage_drop_pct": _format_one_decimal,
+    "length_assumed": _format_length_assumed,
+    "vd_compliant": _format_vd_compliant,
+}
+
+# Every (named style, number format) a SheetTemplate can put on a cell:
+# header and totals rows plus the formatter outputs above
+_TEMPLATE_CELL_STYLES = (
+    ("header", None),
+    ("data", None),
+    ("integer", None),
+    ("number", None),
+    ("assumed", None),
+    ("warning", None),
+    (None, "0.00"),
+    (None, "0.0"),
+    ("subtotal", None),
+    ("subtotal", "#,##0.0"),
+)
+
+
+def _column_resolver(key: str):
+    """
+    Build resolve(item) -> value for one column key.
+
+    Keys without aliases or nesting (most Load List columns) resolve with a
+    single dict lookup; the alias and nested-key fallbacks are only built
+    into columns that need them.
+    """
+    getters = _COMPILED_ALIASES.get(key, ())
+    nested = _alias_getter(key) if "." in key else None
+
+    if not getters and nested is None:
+        return lambda item: item.get(key, "")
+
+    def resolve(item):
+        value = item.get(key, "")
+
+        # Try alternate keys if primary key not found
+        if value is None or value == "":
+            for getter in getters:
+                alt_value = getter(item)
+                if alt_value is not None and alt_value != "":
+                    value = alt_value
+                    break
+
+        # Handle nested keys (e.g., "feeder_counts.dol")
+        if (value is None or value == "") and nested is not None:
+            value = nested(item)
+
+        return value
+
+    return resolve
+
+
+@lru_cache(maxsize=None)
+def _compile_columns(columns: tuple) -> tuple:
+    """
+    Specialize a column definition into per-column resolvers and formatters.
+
+    Returns:
+        tuple of (resolve, formatter), where resolve(item) returns the raw
+        value and formatter(value) returns (cell value, style name or None,
+        number format or None)
+    """
+    return tuple(
+        (_column_resolver(key), _COLUMN_FORMATTERS.get(key, _format_value))
+        for key, _, _ in columns
+    )
+
+
+def _styled_cell(ws, value, style: str = None, number_format: str = None) -> WriteOnlyCell:
+    """Write-only cell carrying a named style and/or number format."""
+    cell = WriteOnlyCell(ws, value=value)
+    if style:
+        cell.style = style
+    if number_format:
+        cell.number_format = number_format
+    return cell
+
+
+class SheetTemplate:
+    """
+    Sheet-invariant layout for a column definition, built once.
+
+    Holds everything write_generic_sheet would otherwise redo per sheet:
+    headers, widths, column letters, compiled resolvers/formatters and
+    the indices of totalled columns.
+    """
+
+    def __init__(self, columns: list, add_totals: list = None):
+        self.columns = tuple(columns)
+        self.add_totals = tuple(add_totals or ())
+        self.headers = tuple(header for _, header, _ in columns)
+        self.widths = tuple(width for _, _, width in columns)
+        self.col_letters = tuple(get_column_letter(i) for i in range(1, len(columns) + 1))
+        self.compiled = _compile_columns(tuple(columns))
+        totals = set(add_totals or ())
+        self.totals_cols = tuple(
+            col_idx for col_idx, (key, _, _) in enumerate(columns) if key in totals
+        )
+
+    def __reduce__(self):
+        # Compiled resolvers are closures; rebuild from the definition when
+        # a template is sent to a worker process
+        return _sheet_template, (self.columns, self.add_totals)
+
+
+@lru_cache(maxsize=None)
+def _sheet_template(columns: tuple, add_totals: tuple) -> SheetTemplate:
+    return SheetTemplate(list(columns), list(add_totals))
+
+
+def apply_template(ws, data: Iterable[dict], template: SheetTemplate, title: str = None):
+    """
+    Write a column-defined sheet from a prebuilt template.
+
+    Rows are streamed with ws.append, so column widths, freeze panes and
+    other sheet-level settings are applied before the first row. data may
+    be any iterable of row dicts (e.g. a generator); it is consumed once.
+    The sheet keeps its current title unless one is given.
+    """
+    if title:
+        ws.title = title[:31]  # Excel max 31 chars
 
     start_row = 1
+    col_letters = template.col_letters
+
+    # Column widths and frozen header must be set before rows are streamed
+    for col_letter, width in zip(col_letters, template.widths):
+        ws.column_dimensions[col_letter].width = width
+    ws.freeze_panes = f"A{start_row + 1}"
 
     # Write headers
-    for col_idx, (key, header, width) in enumerate(columns, 1):
-        cell = ws.cell(row=start_row, column=col_idx, value=header)
-        cell.style = "header"
-        ws.column_dimensions[get_column_letter(col_idx)].width = width
+    ws.append([_styled_cell(ws, header, "header") for header in template.headers])
 
     # Write data
-    for row_idx, item in enumerate(data, start_row + 1):
-        for col_idx, (key, _, _) in enumerate(columns, 1):
-            value = item.get(key, "")
-
-            # Try alternate keys if primary key not found
-            if value in ("", None) and key in KEY_ALIASES:
-                for alt_key in KEY_ALIASES[key]:
-                    if "." in alt_key:
-                        # Handle nested alternate keys
-                        parts = alt_key.split(".")
-                        alt_value = item
-                        for part in parts:
-                            alt_value = alt_value.get(part, "") if isinstance(alt_value, dict) else ""
-                        if alt_value not in ("", None):
-                            value = alt_value
-                            break
-                    else:
-                        alt_value = item.get(alt_key, "")
-                        if alt_value not in ("", None):
-                            value = alt_value
-                            break
-
-            # Handle nested keys (e.g., "feeder_counts.dol")
-            if value in ("", None) and "." in key:
-                parts = key.split(".")
-                value = item
-                for part in parts:
-                    value = value.get(part, "") if isinstance(value, dict) else ""
-
-            # Handle special formatting
-            if key in ["load_factor", "diversity_factor", "pf", "impedance_pct"]:
-                cell = ws.cell(row=row_idx, column=col_idx, value=value if value else 0)
-                cell.number_format = "0.00"
-            elif key in ["efficiency_pct", "loading_pct", "spare_capacity_pct", "voltage_drop_pct"]:
-                cell = ws.cell(row=row_idx, column=col_idx, value=value if value else 0)
-                cell.number_format = "0.0"
-            elif key == "length_assumed" and value:
-                cell = ws.cell(row=row_idx, column=col_idx, value="Yes" if value else "No")
-                cell.style = "assumed" if value else "data"
-            elif key == "vd_compliant":
-                cell = ws.cell(row=row_idx, column=col_idx, value="Yes" if value else "No")
-                cell.style = "data" if value else "warning"
-            elif isinstance(value, bool):
-                cell = ws.cell(row=row_idx, column=col_idx, value="Yes" if value else "No")
-                cell.style = "data"
-            elif isinstance(value, (int, float)):
-                cell = ws.cell(row=row_idx, column=col_idx, value=value)
-                if isinstance(value, int):
-                    cell.style = "integer"
-                else:
-                    cell.style = "number"
-            elif isinstance(value, list):
-                cell = ws.cell(row=row_idx, column=col_idx, value=", ".join(str(v) for v in value))
-                cell.style = "data"
+    # Write-only sheets serialize a row as soon as it is appended, so styled
+    # cells are created once per (column, style, number format) and reused
+    cell_pool = {}
+    n_rows = 0
+    for item in data:
+        n_rows += 1
+        row = []
+        for col_idx, (resolve, formatter) in enumerate(template.compiled):
+            value, style, number_format = formatter(resolve(item))
+            pool_key = (col_idx, style, number_format)
+            cell = cell_pool.get(pool_key)
+            if cell is None:
+                cell = cell_pool[pool_key] = _styled_cell(ws, value, style, number_format)
             else:
-                cell = ws.cell(row=row_idx, column=col_idx, value=str(value) if value else "")
-                cell.style = "data"
+                cell.value = value
+            row.append(cell)
+        ws.append(row)
 
     # Add totals row if requested
-    if add_totals and data:
-        total_row = len(data) + start_row + 1
-        ws.cell(row=total_row, column=1, value="TOTAL").style = "subtotal"
-        for col_idx, (key, _, _) in enumerate(columns, 1):
-            if key in add_totals:
-                col_letter = get_column_letter(col_idx)
-                cell = ws.cell(
-                    row=total_row, column=col_idx,
-                    value=f"=SUM({col_letter}{start_row+1}:{col_letter}{total_row-1})"
-                )
-                cell.style = "subtotal"
-                cell.number_format = "#,##0.0"
+    if template.totals_cols and n_rows:
+        total_row = n_rows + start_row + 1
+        row = [None] * len(col_letters)
+        row[0] = _styled_cell(ws, "TOTAL", "subtotal")
+        for col_idx in template.totals_cols:
+            col_letter = col_letters[col_idx]
+            row[col_idx] = _styled_cell(
+                ws, f"=SUM({col_letter}{start_row+1}:{col_letter}{total_row-1})",
+                "subtotal", "#,##0.0"
+            )
+        ws.append(row)
 
     # Add autofilter
-    if data:
-        ws.auto_filter.ref = f"A{start_row}:{get_column_letter(len(columns))}{len(data)+start_row}"
+    if n_rows:
+        ws.auto_filter.ref = f"A{start_row}:{col_letters[-1]}{n_rows+start_row}"
 
-    # Freeze header row
-    ws.freeze_panes = f"A{start_row + 1}"
 
+def write_generic_sheet(ws, data: Iterable[dict], columns: list, styles: dict,
+                        title: str = None, add_totals: list = None):
+    """
+    Generic sheet writer with column definitions.
 
-def write_load_list_sheet(ws, loads: list[dict], styles: dict):
+    The layout is compiled to a SheetTemplate once per (columns, add_totals)
+    and cached; see apply_template.
+    """
+    template = _sheet_template(tuple(columns), tuple(add_totals or ()))
+    apply_template(ws, data, template, title=title or "Data")
+
+
+_LOAD_LIST_TEMPLATE = _sheet_template(
+    tuple(LOAD_LIST_COLUMNS), ("rated_kw", "running_kw", "demand_kw", "daily_kwh")
+)
+_MCC_BUCKET_TEMPLATE = _sheet_template(tuple(MCC_BUCKET_COLUMNS), ("motor_kw",))
+_MCC_PANEL_TEMPLATE = _sheet_template(
+    tuple(MCC_PANEL_COLUMNS),
+    ("connected_kw", "running_kw", "demand_kw", "demand_kva", "bucket_count")
+)
+_CABLE_SCHEDULE_TEMPLATE = _sheet_template(tuple(CABLE_SCHEDULE_COLUMNS), ("length_m",))
+_PLANT_SUMMARY_TEMPLATE = _sheet_template(tuple(PLANT_SUMMARY_COLUMNS), ())
+_TRANSFORMER_TEMPLATE = _sheet_template(
+    tuple(TRANSFORMER_COLUMNS), ("rating_kva", "connected_kva", "demand_kva")
+)
+
+
+def write_load_list_sheet(ws, loads: list[dict], styles: dict, title: str = "Load List"):
     """Write the Load List sheet."""
-    write_generic_sheet(
-        ws, loads, LOAD_LIST_COLUMNS, styles,
-        title="Load List",
-        add_totals=["rated_kw", "running_kw", "demand_kw", "daily_kwh"]
-    )
+    apply_template(ws, loads, _LOAD_LIST_TEMPLATE, title=title)
 
 
 def write_mcc_bucket_sheet(ws, buckets: list[dict], styles: dict):
     """Write the MCC Bucket Schedule sheet."""
-    write_generic_sheet(
-        ws, buckets, MCC_BUCKET_COLUMNS, styles,
-        title="MCC Bucket Schedule",
-        add_totals=["motor_kw"]
-    )
+    apply_template(ws, buckets, _MCC_BUCKET_TEMPLATE, title="MCC Bucket Schedule")
 
 
-def write_mcc_panel_sheet(ws, panels: list[dict], styles: dict):
-    """Write the MCC Panel Summary sheet."""
-    # Flatten feeder counts for export
-    flat_panels = []
+def _flatten_feeder_counts(panels: Iterable[dict]) -> Iterator[dict]:
+    """Yield panels with feeder counts flattened for export, one at a time."""
     for panel in panels:
         flat = dict(panel)
         counts = panel.get("feeder_counts", {})
         flat["feeder_count_dol"] = counts.get("dol", 0)
         flat["feeder_count_vfd"] = counts.get("vfd", 0)
         flat["feeder_count_ss"] = counts.get("soft_starter", 0)
-        flat_panels.append(flat)
+        yield flat
 
-    write_generic_sheet(
-        ws, flat_panels, MCC_PANEL_COLUMNS, styles,
-        title="MCC Panel Summary",
-        add_totals=["connected_kw", "running_kw", "demand_kw", "demand_kva", "bucket_count"]
+
+def write_mcc_panel_sheet(ws, panels: list[dict], styles: dict):
+    """Write the MCC Panel Summary sheet."""
+    apply_template(
+        ws, _flatten_feeder_counts(panels), _MCC_PANEL_TEMPLATE, title="MCC Panel Summary"
     )
 
 
 def write_cable_schedule_sheet(ws, cables: list[dict], styles: dict):
     """Write the Cable Schedule sheet."""
-    write_generic_sheet(
-        ws, cables, CABLE_SCHEDULE_COLUMNS, styles,
-        title="Cable Schedule",
-        add_totals=["length_m"]
-    )
-
+    apply_template(ws, cables, _CABLE_SCHEDULE_TEMPLATE, title="Cable Schedule")
 
-def write_plant_summary_sheet(ws, summary: dict, styles: dict):
-    """Write the Plant Load Summary sheet."""
-    ws.title = "Plant Summary"
 
-    # Build summary rows
+def _plant_summary_rows(summary: dict) -> list[dict]:
+    """Rows of the Plant Load Summary sheet."""
     rows = []
     s = summary.get("summary", {})
 
@@ -457,19 +619,18 @@ def write_plant_summary_sheet(ws, summary: dict, styles: dict):
         "notes": "Transformer sizing basis"
     })
 
-    write_generic_sheet(
-        ws, rows, PLANT_SUMMARY_COLUMNS, styles,
-        title="Plant Summary"
-    )
+    return rows
+
+
+def write_plant_summary_sheet(ws, summary: dict, styles: dict):
+    """Write the Plant Load Summary sheet."""
+    apply_template(ws, _plant_summary_rows(summary), _PLANT_SUMMARY_TEMPLATE,
+                   title="Plant Summary")
 
 
 def write_transformer_sheet(ws, transformers: list[dict], styles: dict):
     """Write the Transformer Schedule sheet."""
-    write_generic_sheet(
-        ws, transformers, TRANSFORMER_COLUMNS, styles,
-        title="Transformer Schedule",
-        add_totals=["rating_kva", "connected_kva", "demand_kva"]
-    )
+    apply_template(ws, transformers, _TRANSFORMER_TEMPLATE, title="Transformer Schedule")
 
 
 def write_energy_summary_sheet(ws, summary: dict, styles: dict):
@@ -492,53 +653,174 @@ def write_energy_summary_sheet(ws, summary: dict, styles: dict):
         ("Specific Energy (kWh/m³)", summary.get("specific_energy_kwh_m3", 0), "number"),
     ]
 
+    # Set column widths
+    ws.column_dimensions["A"].width = 25
+    ws.column_dimensions["B"].width = 15
+
     for row_idx, (label, value, style) in enumerate(rows, 1):
         if style == "title":
-            cell = ws.cell(row=row_idx, column=1, value=label)
-            cell.style = "title"
-            ws.merge_cells(f"A{row_idx}:B{row_idx}")
+            ws.append([_styled_cell(ws, label, "title")])
+            ws.merged_cells.add(f"A{row_idx}:B{row_idx}")
         else:
-            ws.cell(row=row_idx, column=1, value=label).style = "data"
+            row = [_styled_cell(ws, label, "data")]
             if value is not None:
-                cell = ws.cell(row=row_idx, column=2, value=value)
-                if style == "number":
-                    cell.number_format = "#,##0.00"
-
-    # Set column widths
-    ws.column_dimensions["A"].width = 25
-    ws.column_dimensions["B"].width = 15
+                row.append(_styled_cell(
+                    ws, value, number_format="#,##0.00" if style == "number" else None
+                ))
+            ws.append(row)
 
 
 def write_disclaimer_sheet(ws, disclaimers: list[str], output_tier: int, styles: dict):
     """Write disclaimers and notes sheet."""
     ws.title = "Notes"
 
+    ws.column_dimensions["A"].width = 80
+
     # Title
-    ws.cell(row=1, column=1, value="LOAD LIST NOTES AND DISCLAIMERS").style = "title"
-    ws.merge_cells("A1:C1")
+    ws.append([_styled_cell(ws, "LOAD LIST NOTES AND DISCLAIMERS", "title")])
+    ws.merged_cells.add("A1:C1")
+    ws.append([])
 
     # Output tier
     tier_names = {1: "Load Study", 2: "Preliminary Schedule", 3: "Code-Compliant"}
-    ws.cell(row=3, column=1, value="Output Tier:")
-    ws.cell(row=3, column=2, value=f"Tier {output_tier} - {tier_names.get(output_tier, 'Unknown')}")
+    ws.append([
+        "Output Tier:",
+        f"Tier {output_tier} - {tier_names.get(output_tier, 'Unknown')}"
+    ])
+    ws.append([])
 
     # Disclaimers
-    ws.cell(row=5, column=1, value="DISCLAIMERS").style = "header"
-    for idx, disclaimer in enumerate(disclaimers, 6):
-        ws.cell(row=idx, column=1, value=f"• {disclaimer}").style = "data"
+    ws.append([_styled_cell(ws, "DISCLAIMERS", "header")])
+    for disclaimer in disclaimers:
+        ws.append([_styled_cell(ws, f"• {disclaimer}", "data")])
 
-    ws.column_dimensions["A"].width = 80
+
+# =============================================================================
+# PARALLEL SHEET RENDERING (fast XML path)
+# =============================================================================
+
+# Below this many column-defined sheets, process startup outweighs the gain
+_MIN_PARALLEL_SHEETS = 3
+
+
+def _register_template_styles(ws) -> list:
+    """
+    Register every template cell style with ws's workbook, in fixed order.
+
+    Done right after create_styles() on a fresh workbook, this yields the
+    same style ids in every process.
+
+    Returns:
+        list of style ids, one per _TEMPLATE_CELL_STYLES entry
+    """
+    style_ids = []
+    for style, number_format in _TEMPLATE_CELL_STYLES:
+        # Reading style_id is what adds the style to the workbook
+        style_id = _styled_cell(ws, None, style, number_format).style_id
+        style_ids.append(style_id)
+    return style_ids
+
+
+def _render_template_sheet(job: tuple) -> tuple:
+    """
+    Render one column-defined sheet in a worker process.
+
+    Returns:
+        (sheet XML, shared strings, template style ids)
+    """
+    from fast_xlsx import XmlWorkbook
+
+    rows, template = job
+    wb = XmlWorkbook()
+    create_styles(wb)
+    ws = wb.create_sheet()
+    style_ids = _register_template_styles(ws)
+    apply_template(ws, rows, template)
+    xml, strings = ws.export()
+    return xml, strings, style_ids
+
+
+def _write_queued_sheet(ws, rows, template: SheetTemplate, tab_names: dict):
+    """
+    Write one queued sheet in this process.
+
+    Per-MCC tabs (keys of tab_names) keep their warn-and-continue handling:
+    a tab that fails to write is reported and the export carries on.
+    """
+    sheet_name = tab_names.get(ws)
+    if sheet_name is None:
+        apply_template(ws, rows, template)
+        return
+    try:
+        apply_template(ws, rows, template)
+    except Exception as e:
+        print(f"Warning: Could not create sheet '{sheet_name}': {e}")
+
+
+def _write_template_sheets_parallel(queued: list, workers: int, style_ids: list,
+                                    tab_names: dict):
+    """
+    Render queued (ws, rows, template) sheets across worker processes.
+
+    Sheets only share the workbook's shared strings table, which is merged
+    here. A sheet whose worker failed, or registered the template styles
+    under other ids than this workbook did, is rewritten in this process.
+    """
+    jobs = [(list(rows), template) for _, rows, template in queued]
+    # Fork starts every worker up front; never more than there are sheets
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+        futures = [pool.submit(_render_template_sheet, job) for job in jobs]
+
+    for (ws, _, template), (rows, _), future in zip(queued, jobs, futures):
+        if future.exception() is not None:
+            _write_queued_sheet(ws, rows, template, tab_names)
+            continue
+        xml, strings, worker_style_ids = future.result()
+        if worker_style_ids != style_ids:
+            _write_queued_sheet(ws, rows, template, tab_names)
+            continue
+        ws.load_rendered(xml, strings)
 
 
 # =============================================================================
 # MAIN CONVERTER
 # =============================================================================
 
+def save_workbook(wb: Workbook, output_path: Path, compress_level: int = 6):
+    """
+    Save a workbook with a chosen zip compression level.
+
+    openpyxl always deflates at zlib's default level 6. Level 1 spends less
+    time in zlib for a larger file, and 0 stores the parts uncompressed.
+
+    Args:
+        wb: Workbook to save
+        output_path: Output .xlsx path
+        compress_level: 0 (stored), 1-9 (deflate level); default 6
+    """
+    if compress_level == 6:
+        wb.save(output_path)
+        return
+
+    if compress_level:
+        archive = ZipFile(output_path, "w", ZIP_DEFLATED, allowZip64=True,
+                          compresslevel=compress_level)
+    else:
+        archive = ZipFile(output_path, "w", ZIP_STORED, allowZip64=True)
+    wb.properties.modified = datetime.datetime.now(
+        tz=datetime.timezone.utc
+    ).replace(tzinfo=None)
+    ExcelWriter(wb, archive).save()
+
+
 def convert_yaml_to_xlsx(
     input_path: Path,
     output_path: Path,
     include_mcc_tabs: bool = True,
-    include_cable_schedule: bool = True
+    include_cable_schedule: bool = True,
+    fast_xml: bool = False,
+    compress_level: int = 6,
+    workers: int = 1
 ):
     """
     Convert load list YAML to Excel workbook.
@@ -548,10 +830,15 @@ def convert_yaml_to_xlsx(
         output_path: Path for output Excel file
         include_mcc_tabs: Include per-MCC tabs (default True)
         include_cable_schedule: Include cable schedule sheet (default True)
+        fast_xml: Write sheet XML directly instead of through openpyxl's
+            cell serializer (default False)
+        compress_level: Zip compression level, 0 for stored (default 6)
+        workers: Processes rendering sheets with fast_xml (default 1,
+            which renders in this process)
     """
     # Load YAML
-    with open(input_path) as f:
-        data = yaml.safe_load(f)
+    with open(input_path, "rb") as f:
+        data = yaml.load(f, Loader=_YamlLoader)
 
     loads = data.get("loads", [])
     panels = data.get("mcc_panels", [])
@@ -586,37 +873,72 @@ def convert_yaml_to_xlsx(
     if not disclaimers:
         disclaimers = data.get("disclaimers", [])
 
-    # Create workbook
-    wb = Workbook()
-    styles = create_styles(wb)
+    # The fast XML writer depends on openpyxl internals; outside the
+    # releases it was tested with, write through openpyxl instead
+    if fast_xml:
+        try:
+            from fast_xlsx import OPENPYXL_SUPPORTED, XmlWorkbook
+        except ImportError:
+            OPENPYXL_SUPPORTED = False
+        if not OPENPYXL_SUPPORTED:
+            print(f"Warning: --fast-xml is not tested with openpyxl {OPENPYXL_VERSION}; "
+                  f"using the standard writer")
+            fast_xml = False
+
+    # Create workbook; write-only mode streams rows to disk instead of
+    # keeping every cell object in memory
+    if fast_xml:
+        wb = XmlWorkbook()
+    else:
+        wb = Workbook(write_only=True)
+
+    # Binding a named style to a workbook is not free; with nothing but the
+    # header-only Load List and Notes to write, register just what they use
+    has_content = any((loads, buckets, panels, cables, plant_summary,
+                       transformers, energy_summary))
+    styles = create_styles(wb, None if has_content else _BASE_STYLE_NAMES)
+
+    # Column-defined sheets are queued as (ws, rows, template) and written
+    # once every sheet exists, so the fast XML path can render them in
+    # worker processes. Per-MCC tabs are also keyed in tab_names, so a tab
+    # that fails to write only warns, as it did when written inline.
+    queued = []
+    tab_names = {}
+    if not (fast_xml and has_content):
+        workers = 1
 
     # 1. Load List sheet (always first)
-    write_load_list_sheet(wb.active, loads, styles)
+    load_ws = wb.create_sheet("Load List")
+    queued.append((load_ws, loads, _LOAD_LIST_TEMPLATE))
+    if workers > 1:
+        # Before any other cell, so style ids match the workers'
+        style_ids = _register_template_styles(load_ws)
 
     # 2. MCC Bucket Schedule (if data available)
     if buckets:
-        bucket_ws = wb.create_sheet()
-        write_mcc_bucket_sheet(bucket_ws, buckets, styles)
+        queued.append((wb.create_sheet("MCC Bucket Schedule"), buckets, _MCC_BUCKET_TEMPLATE))
 
     # 3. MCC Panel Summary
     if panels:
-        panel_ws = wb.create_sheet()
-        write_mcc_panel_sheet(panel_ws, panels, styles)
+        queued.append((
+            wb.create_sheet("MCC Panel Summary"), _flatten_feeder_counts(panels),
+            _MCC_PANEL_TEMPLATE
+        ))
 
     # 4. Cable Schedule (if requested and data available)
     if include_cable_schedule and cables:
-        cable_ws = wb.create_sheet()
-        write_cable_schedule_sheet(cable_ws, cables, styles)
+        queued.append((wb.create_sheet("Cable Schedule"), cables, _CABLE_SCHEDULE_TEMPLATE))
 
     # 5. Plant Summary (if available)
     if plant_summary:
-        summary_ws = wb.create_sheet()
-        write_plant_summary_sheet(summary_ws, plant_summary, styles)
+        queued.append((
+            wb.create_sheet("Plant Summary"), _plant_summary_rows(plant_summary),
+            _PLANT_SUMMARY_TEMPLATE
+        ))
 
     # 6. Transformer Schedule (if available)
     if transformers:
-        xfmr_ws = wb.create_sheet()
-        write_transformer_sheet(xfmr_ws, transformers, styles)
+        queued.append((wb.create_sheet("Transformer Schedule"), transformers, _TRANSFORMER_TEMPLATE))
 
     # 7. Energy Summary sheet
     if energy_summary:
@@ -628,22 +950,38 @@ def convert_yaml_to_xlsx(
     write_disclaimer_sheet(notes_ws, disclaimers, output_tier, styles)
 
     # 9. Optional: Per-MCC tabs
-    if include_mcc_tabs and panels:
+    if include_mcc_tabs and panels and loads:
+        # Group loads by panel in one pass
+        loads_by_panel = defaultdict(list)
+        for load in loads:
+            loads_by_panel[load.get("mcc_panel")].append(load)
+
         for panel in panels:
             panel_tag = panel.get("panel_tag", "UNKNOWN")
-            panel_loads = [l for l in loads if l.get("mcc_panel") == panel_tag]
+            panel_loads = loads_by_panel.get(panel_tag)
             if panel_loads:
                 # Sanitize sheet name (max 31 chars, no special chars)
                 sheet_name = panel_tag[:31].replace("/", "-").replace("\\", "-")
                 try:
                     panel_ws = wb.create_sheet(title=sheet_name)
-                    write_load_list_sheet(panel_ws, panel_loads, styles)
                 except Exception as e:
                     print(f"Warning: Could not create sheet '{sheet_name}': {e}")
+                    continue
+                queued.append((panel_ws, panel_loads, _LOAD_LIST_TEMPLATE))
+                tab_names[panel_ws] = sheet_name
+
+    if workers > 1 and len(queued) >= _MIN_PARALLEL_SHEETS:
+        _write_template_sheets_parallel(queued, workers, style_ids, tab_names)
+    else:
+        for ws, rows, template in queued:
+            _write_queued_sheet(ws, rows, template, tab_names)
 
     # Save workbook
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    wb.save(output_path)
+    if fast_xml:
+        wb.save(output_path, compress_level=compress_level)
+    else:
+        save_workbook(wb, output_path, compress_level)
 
     return {
         "loads": len(loads),
@@ -679,6 +1017,24 @@ def main():
         action="store_true",
         help="Don't include cable schedule sheet"
     )
+    parser.add_argument(
+        "--fast-xml",
+        action="store_true",
+        help="Write sheet XML directly (faster for large load lists)"
+    )
+    parser.add_argument(
+        "--compress-level",
+        type=int,
+        choices=(0, 1, 6),
+        default=6,
+        help="Zip compression level: 0 = stored, 1 = fastest, 6 = default"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes rendering sheets with --fast-xml (default: 1, no worker processes)"
+    )
 
     args = parser.parse_args()
 
@@ -692,7 +1048,10 @@ def main():
         args.input,
         args.output,
         include_mcc_tabs=not args.no_mcc_tabs,
-        include_cable_schedule=not args.no_cable_schedule
+        include_cable_schedule=not args.no_cable_schedule,
+        fast_xml=args.fast_xml,
+        compress_level=args.compress_level,
+        workers=args.workers
     )
 
     print(f"Done! Exported:")